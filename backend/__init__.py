@@ -0,0 +1,3 @@
+"""
+Quantum Chemistry Lab backend package.
+"""
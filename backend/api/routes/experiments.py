@@ -1,110 +1,272 @@
 """
 API endpoints for experiments.
 """
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from sqlalchemy.orm import Session
-from typing import List, Dict, Any
-import sys
-import os
-
-# Add the parent directory to path so we can import modules
-sys.path.append(os.path.abspath(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
-from db.database import get_db
-from db.models import Experiment, ExperimentResult
-from schemas.experiments import (
-    ExperimentCreate, ExperimentDB, ResourceEstimate, ExperimentStatus
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import ValidationError
+from typing import List, Dict, Any, Optional
+import asyncio
+import logging
+
+from ...db.database import SessionLocal, get_db
+from ...db.models import Experiment, ExperimentResult
+from ...schemas.experiments import (
+    ExperimentCreate, ExperimentDB, ExperimentSummary, ResourceEstimate, ExperimentStatus
 )
-from schemas.results import ExperimentResultCreate, ExperimentResultDB
-from quantum.manager import QuantumModuleManager
+from ...schemas.results import ExperimentResultCreate, ExperimentResultDB
+from ...quantum.manager import QuantumModuleManager
+from ...quantum import worker
+from ...utils.cache import cache_add, cache_get, cache_set, cache_delete
+from ...utils.helpers import row_to_dict
+from ...config import QUANTUM_MAX_JOBS, JOB_STATUS_TTL
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Bounds concurrent experiment runs so they don't starve the rest of the API
+_JOB_SEM = asyncio.Semaphore(QUANTUM_MAX_JOBS)
+
+
+async def _parse_experiment_create(request: Request) -> ExperimentCreate:
+    """Validate the request body straight from JSON bytes, skipping the intermediate dict."""
+    try:
+        return ExperimentCreate.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
 
-@router.post("/experiments", response_model=ExperimentDB)
+
+@router.post(
+    "/experiments",
+    response_model=ExperimentDB,
+    # The body is parsed by _parse_experiment_create, so document it explicitly
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": ExperimentCreate.model_json_schema(
+                        ref_template="#/components/schemas/{model}"
+                    )
+                }
+            },
+        }
+    },
+)
 async def create_experiment(
-    experiment: ExperimentCreate,
-    db: Session = Depends(get_db)
+    experiment: ExperimentCreate = Depends(_parse_experiment_create),
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new experiment."""
-    # Create DB record
-    db_experiment = Experiment(
+    # Insert and read back the row in a single round-trip
+    stmt = insert(Experiment).values(
         name=experiment.name or f"Experiment {experiment.system_id}",
         system_id=experiment.system_id,
         basis_set=experiment.basis_set,
         experiment_type=experiment.experiment_type,
-        configuration=experiment.configuration.dict()
-    )
-    
-    # Add to database
-    db.add(db_experiment)
-    db.commit()
-    db.refresh(db_experiment)
+        configuration=experiment.configuration.model_dump(mode="json")
+    ).returning(Experiment)
+    db_experiment = (await db.execute(stmt)).scalar_one()
+    await db.commit()
     
     return db_experiment
 
 
-@router.get("/experiments", response_model=List[ExperimentDB])
+@router.get("/experiments", response_model=List[ExperimentSummary])
 async def get_experiments(
-    db: Session = Depends(get_db),
-    skip: int = 0,
+    db: AsyncSession = Depends(get_db),
+    after_id: Optional[int] = None,
     limit: int = 100
 ):
-    """Get all experiments."""
-    return db.query(Experiment).offset(skip).limit(limit).all()
+    """Get experiments newest first, without loading their configuration JSON.
+
+    Pass the last ID of a page as `after_id` to fetch the next page.
+    """
+    # Plain column rows serialize straight to JSON, skipping ORM and model validation
+    stmt = (
+        select(
+            Experiment.id,
+            Experiment.name,
+            Experiment.system_id,
+            Experiment.basis_set,
+            Experiment.experiment_type,
+            Experiment.created_at,
+        )
+        .order_by(Experiment.id.desc())
+        .limit(limit)
+    )
+    if after_id is not None:
+        stmt = stmt.where(Experiment.id < after_id)
+    result = await db.execute(stmt)
+    return ORJSONResponse([dict(row) for row in result.mappings()])
 
 
 @router.get("/experiments/{experiment_id}", response_model=ExperimentDB)
 async def get_experiment(
     experiment_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get a specific experiment by ID."""
-    experiment = db.query(Experiment).filter(Experiment.id == experiment_id).first()
+    cache_key = f"exp:{experiment_id}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
+    experiment = (
+        await db.execute(select(Experiment).where(Experiment.id == experiment_id))
+    ).scalar_one_or_none()
     if not experiment:
         raise HTTPException(status_code=404, detail=f"Experiment {experiment_id} not found")
-    return experiment
+    
+    payload = row_to_dict(experiment)
+    await cache_set(cache_key, payload)
+    return ORJSONResponse(payload)
 
 
-@router.post("/experiments/{experiment_id}/run", response_model=ExperimentResultDB)
-async def run_experiment(
-    experiment_id: int,
-    background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db)
-):
-    """Run an experiment and store the results."""
-    # Get experiment from DB
-    experiment = db.query(Experiment).filter(Experiment.id == experiment_id).first()
-    if not experiment:
-        raise HTTPException(status_code=404, detail=f"Experiment {experiment_id} not found")
-    
-    # Run the experiment
-    result = QuantumModuleManager.run_experiment(
-        system_id=experiment.system_id,
-        basis_set=experiment.basis_set,
-        experiment_type=experiment.experiment_type,
-        configuration=experiment.configuration
-    )
+async def _compute(experiment: Experiment) -> Dict[str, Any]:
+    """Run the quantum computation for an experiment, raising on adapter errors."""
+    # Run the experiment in a worker process so the event loop keeps serving requests
+    async with _JOB_SEM:
+        result = await worker.run_experiment(
+            system_id=experiment.system_id,
+            basis_set=experiment.basis_set,
+            experiment_type=experiment.experiment_type,
+            configuration=experiment.configuration
+        )
     
     # Check for errors
     if "error" in result:
         raise HTTPException(status_code=500, detail=result["error"])
-    
-    # Store results in DB
-    db_result = ExperimentResult(
-        experiment_id=experiment.id,
+    return result
+
+
+async def _store_result(db: AsyncSession, experiment_id: int, result: Dict[str, Any]) -> ExperimentResult:
+    """Insert a computed result and invalidate the cached result list."""
+    stmt = insert(ExperimentResult).values(
+        experiment_id=experiment_id,
         energy=result["energy"],
         reference_energy=result.get("reference_energy"),
         iterations=result["iterations"],
         runtime=result["runtime"],
         convergence=result.get("convergence"),
         data=result["data"]
-    )
+    ).returning(ExperimentResult)
+    db_result = (await db.execute(stmt)).scalar_one()
+    await db.commit()
+    await cache_delete(f"exp:{experiment_id}:results")
+    return db_result
+
+
+# Background run status lives in the response cache (shared through Redis when
+# configured). Pending and running entries are kept for a day so long runs don't
+# expire mid-flight; finished ones expire after JOB_STATUS_TTL.
+_ACTIVE_STATUS_TTL = 86400
+
+
+def _job_claim_key(experiment_id: int) -> str:
+    """Cache key held while an experiment has a queued or running background run."""
+    return f"exp:{experiment_id}:job"
+
+
+async def _set_job_status(status: Dict[str, Any]) -> None:
+    """Record a background run's status."""
+    expire = _ACTIVE_STATUS_TTL if status["status"] in ("pending", "running") else JOB_STATUS_TTL
+    await cache_set(f"exp:{status['id']}:status", status, expire=expire)
+
+
+async def _run_and_store(experiment: Experiment) -> None:
+    """Background task: compute an experiment and store its result."""
+    await _set_job_status({"id": experiment.id, "status": "running", "progress": 0.0})
+    try:
+        result = await _compute(experiment)
+        # The request's session is gone by now, so use a fresh one
+        async with SessionLocal() as db:
+            db_result = await _store_result(db, experiment.id, result)
+        await _set_job_status({
+            "id": experiment.id,
+            "status": "completed",
+            "progress": 1.0,
+            "message": f"Stored result {db_result.id}",
+        })
+    except Exception as e:
+        message = e.detail if isinstance(e, HTTPException) else str(e)
+        logger.error(f"Error running experiment {experiment.id} in background: {message}")
+        await _set_job_status({"id": experiment.id, "status": "failed", "message": message})
+    finally:
+        await cache_delete(_job_claim_key(experiment.id))
+
+
+@router.post("/experiments/{experiment_id}/run", response_model=ExperimentResultDB)
+async def run_experiment(
+    experiment_id: int,
+    db: AsyncSession = Depends(get_db)
+):
+    """Run an experiment and store the results."""
+    # Get experiment from DB
+    experiment = (
+        await db.execute(select(Experiment).where(Experiment.id == experiment_id))
+    ).scalar_one_or_none()
+    if not experiment:
+        raise HTTPException(status_code=404, detail=f"Experiment {experiment_id} not found")
+    
+    try:
+        result = await _compute(experiment)
+        db_result = await _store_result(db, experiment.id, result)
+        return ORJSONResponse(row_to_dict(db_result))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error running experiment: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/experiments/{experiment_id}/submit", response_model=ExperimentStatus, status_code=202)
+async def submit_experiment(
+    experiment_id: int,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db)
+):
+    """Queue an experiment run in the background; poll its status endpoint for completion."""
+    experiment = (
+        await db.execute(select(Experiment).where(Experiment.id == experiment_id))
+    ).scalar_one_or_none()
+    if not experiment:
+        raise HTTPException(status_code=404, detail=f"Experiment {experiment_id} not found")
     
-    db.add(db_result)
-    db.commit()
-    db.refresh(db_result)
+    # Claim the run atomically (SET NX), so concurrent submits schedule it only once;
+    # failed or finished runs have released the claim and can be submitted again
+    if not await cache_add(_job_claim_key(experiment_id), True, expire=_ACTIVE_STATUS_TTL):
+        current = await cache_get(f"exp:{experiment_id}:status")
+        if current is not None and current["status"] in ("pending", "running"):
+            return current
+        # The claiming request has not recorded its status yet
+        return {"id": experiment_id, "status": "pending", "progress": 0.0}
     
-    return db_result
+    status = {"id": experiment_id, "status": "pending", "progress": 0.0}
+    await _set_job_status(status)
+    background_tasks.add_task(_run_and_store, experiment)
+    return status
+
+
+@router.get("/experiments/{experiment_id}/status", response_model=ExperimentStatus)
+async def get_experiment_status(
+    experiment_id: int,
+    db: AsyncSession = Depends(get_db)
+):
+    """Get the status of an experiment's background run."""
+    status = await cache_get(f"exp:{experiment_id}:status")
+    if status is not None:
+        return status
+    
+    exists = await db.scalar(select(Experiment.id).where(Experiment.id == experiment_id))
+    if exists is None:
+        raise HTTPException(status_code=404, detail=f"Experiment {experiment_id} not found")
+    return {"id": experiment_id, "status": "idle"}
 
 
 @router.post("/estimate-resources", response_model=ResourceEstimate)
@@ -2,72 +2,131 @@
 API endpoints for experiment results.
 """
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
-import sys
-import os
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from typing import List, Optional
 
-# Add the parent directory to path so we can import modules
-sys.path.append(os.path.abspath(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
-from db.database import get_db
-from db.models import Experiment, ExperimentResult
-from schemas.results import ExperimentResultDB, ExperimentResultDetails
-from config import AVAILABLE_SYSTEMS
+from ...db.database import get_db
+from ...db.models import Experiment, ExperimentResult
+from ...schemas.results import ExperimentResultDB, ExperimentResultDetails, ExperimentResultSummary
+from ...config import SYSTEMS_BY_ID
+from ...utils.cache import cache_get, cache_set
+from ...utils.helpers import row_to_dict
 
 router = APIRouter()
 
 
-@router.get("/results", response_model=List[ExperimentResultDB])
+@router.get("/results", response_model=List[ExperimentResultSummary])
 async def get_results(
-    db: Session = Depends(get_db),
-    skip: int = 0,
+    db: AsyncSession = Depends(get_db),
+    after_id: Optional[int] = None,
     limit: int = 100
 ):
-    """Get all experiment results."""
-    return db.query(ExperimentResult).offset(skip).limit(limit).all()
+    """Get experiment results newest first, without loading their data JSON.
+
+    Pass the last ID of a page as `after_id` to fetch the next page.
+    """
+    # Plain column rows serialize straight to JSON, skipping ORM and model validation
+    stmt = (
+        select(
+            ExperimentResult.id,
+            ExperimentResult.experiment_id,
+            ExperimentResult.energy,
+            ExperimentResult.reference_energy,
+            ExperimentResult.iterations,
+            ExperimentResult.runtime,
+            ExperimentResult.convergence,
+            ExperimentResult.created_at,
+        )
+        .order_by(ExperimentResult.id.desc())
+        .limit(limit)
+    )
+    if after_id is not None:
+        stmt = stmt.where(ExperimentResult.id < after_id)
+    results = await db.execute(stmt)
+    return ORJSONResponse([dict(row) for row in results.mappings()])
 
 
 @router.get("/results/{result_id}", response_model=ExperimentResultDB)
 async def get_result(
     result_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get a specific result by ID."""
-    result = db.query(ExperimentResult).filter(ExperimentResult.id == result_id).first()
+    cache_key = f"result:{result_id}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
+    result = (
+        await db.execute(select(ExperimentResult).where(ExperimentResult.id == result_id))
+    ).scalar_one_or_none()
     if not result:
         raise HTTPException(status_code=404, detail=f"Result {result_id} not found")
-    return result
+    
+    payload = row_to_dict(result)
+    await cache_set(cache_key, payload)
+    return ORJSONResponse(payload)
 
 
 @router.get("/experiments/{experiment_id}/results", response_model=List[ExperimentResultDB])
 async def get_experiment_results(
     experiment_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get all results for a specific experiment."""
-    experiment = db.query(Experiment).filter(Experiment.id == experiment_id).first()
+    cache_key = f"exp:{experiment_id}:results"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
+    # Load the experiment and its results in one LEFT OUTER JOIN, so a missing
+    # experiment is still told apart from one without results
+    experiment = (
+        await db.execute(
+            select(Experiment)
+            .options(joinedload(Experiment.results))
+            .where(Experiment.id == experiment_id)
+        )
+    ).unique().scalar_one_or_none()
     if not experiment:
         raise HTTPException(status_code=404, detail=f"Experiment {experiment_id} not found")
     
-    return db.query(ExperimentResult).filter(ExperimentResult.experiment_id == experiment_id).all()
+    payload = [row_to_dict(result) for result in experiment.results]
+    await cache_set(cache_key, payload)
+    return ORJSONResponse(payload)
 
 
 @router.get("/results/{result_id}/details", response_model=ExperimentResultDetails)
 async def get_result_details(
     result_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get detailed information about a result."""
-    result = db.query(ExperimentResult).filter(ExperimentResult.id == result_id).first()
+    cache_key = f"result:{result_id}:details"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
+    # Load the result and its parent experiment in a single query
+    result = (
+        await db.execute(
+            select(ExperimentResult)
+            .options(joinedload(ExperimentResult.experiment))
+            .where(ExperimentResult.id == result_id)
+        )
+    ).scalar_one_or_none()
     if not result:
         raise HTTPException(status_code=404, detail=f"Result {result_id} not found")
     
-    experiment = db.query(Experiment).filter(Experiment.id == result.experiment_id).first()
+    experiment = result.experiment
     if not experiment:
         raise HTTPException(status_code=404, detail=f"Experiment for result {result_id} not found")
     
     # Find system name from config or use ID as fallback
-    system_name = next((s["name"] for s in AVAILABLE_SYSTEMS if s["id"] == experiment.system_id), experiment.system_id)
+    system_name = SYSTEMS_BY_ID.get(experiment.system_id, {"name": experiment.system_id})["name"]
     
     # Create detailed result
     detailed_result = {
@@ -83,4 +142,5 @@ async def get_result_details(
         "configuration": experiment.configuration
     }
     
-    return detailed_result 
\ No newline at end of file
+    await cache_set(cache_key, detailed_result)
+    return ORJSONResponse(detailed_result) 
\ No newline at end of file
@@ -1,49 +1,78 @@
 """
 API endpoints for quantum systems.
 """
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
-import sys
-import os
-
-# Add the parent directory to path so we can import modules
-sys.path.append(os.path.abspath(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
-from db.database import get_db
-from schemas.systems import (
+from fastapi import APIRouter, HTTPException, Request, Response
+import hashlib
+import orjson
+
+from ...schemas.systems import (
     QuantumSystem, BasisSet, ExperimentType,
     QuantumSystemsList, BasisSetsList, ExperimentTypesList
 )
-from config import AVAILABLE_SYSTEMS, AVAILABLE_BASIS_SETS, AVAILABLE_EXPERIMENT_TYPES
+from ...config import AVAILABLE_SYSTEMS, AVAILABLE_BASIS_SETS, AVAILABLE_EXPERIMENT_TYPES
 
 router = APIRouter()
 
+# Static payloads are validated and serialized once at import time; they never change while running
+_SYSTEMS_RESPONSE = QuantumSystemsList(systems=[QuantumSystem(**system) for system in AVAILABLE_SYSTEMS])
+_BASIS_SETS_RESPONSE = BasisSetsList(basis_sets=[BasisSet(**basis) for basis in AVAILABLE_BASIS_SETS])
+_EXPERIMENT_TYPES_RESPONSE = ExperimentTypesList(
+    experiment_types=[ExperimentType(**exp_type) for exp_type in AVAILABLE_EXPERIMENT_TYPES]
+)
+
+_SYSTEMS_BYTES = orjson.dumps(_SYSTEMS_RESPONSE.model_dump(mode="json"))
+_BASIS_SETS_BYTES = orjson.dumps(_BASIS_SETS_RESPONSE.model_dump(mode="json"))
+_EXPERIMENT_TYPES_BYTES = orjson.dumps(_EXPERIMENT_TYPES_RESPONSE.model_dump(mode="json"))
+_SYSTEM_BYTES_BY_ID = {
+    system.id: orjson.dumps(system.model_dump(mode="json")) for system in _SYSTEMS_RESPONSE.systems
+}
+
+
+def _etag(content: bytes) -> str:
+    """Build a strong ETag from the serialized payload."""
+    return '"' + hashlib.sha1(content).hexdigest() + '"'
+
+
+_SYSTEMS_ETAG = _etag(_SYSTEMS_BYTES)
+_BASIS_SETS_ETAG = _etag(_BASIS_SETS_BYTES)
+_EXPERIMENT_TYPES_ETAG = _etag(_EXPERIMENT_TYPES_BYTES)
+_SYSTEM_ETAGS_BY_ID = {system_id: _etag(content) for system_id, content in _SYSTEM_BYTES_BY_ID.items()}
+
+
+# The catalogue only changes on redeploy; browsers revalidate with the ETag after an hour
+_CACHE_CONTROL = "public, max-age=3600"
+
+
+def _cached_response(request: Request, content: bytes, etag: str) -> Response:
+    """Return 304 when the client already holds the payload, otherwise the prebuilt bytes."""
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
+
 
 @router.get("/systems", response_model=QuantumSystemsList)
-async def get_quantum_systems():
+async def get_quantum_systems(request: Request):
     """Get all available quantum systems."""
-    systems = [QuantumSystem(**system) for system in AVAILABLE_SYSTEMS]
-    return {"systems": systems}
+    return _cached_response(request, _SYSTEMS_BYTES, _SYSTEMS_ETAG)
 
 
 @router.get("/systems/{system_id}", response_model=QuantumSystem)
-async def get_quantum_system(system_id: str):
+async def get_quantum_system(system_id: str, request: Request):
     """Get a specific quantum system by ID."""
-    system = next((s for s in AVAILABLE_SYSTEMS if s["id"] == system_id), None)
-    if not system:
+    content = _SYSTEM_BYTES_BY_ID.get(system_id)
+    if content is None:
         raise HTTPException(status_code=404, detail=f"System {system_id} not found")
-    return system
+    return _cached_response(request, content, _SYSTEM_ETAGS_BY_ID[system_id])
 
 
 @router.get("/basis-sets", response_model=BasisSetsList)
-async def get_basis_sets():
+async def get_basis_sets(request: Request):
     """Get all available basis sets."""
-    basis_sets = [BasisSet(**basis) for basis in AVAILABLE_BASIS_SETS]
-    return {"basis_sets": basis_sets}
+    return _cached_response(request, _BASIS_SETS_BYTES, _BASIS_SETS_ETAG)
 
 
 @router.get("/experiment-types", response_model=ExperimentTypesList)
-async def get_experiment_types():
+async def get_experiment_types(request: Request):
     """Get all available experiment types."""
-    experiment_types = [ExperimentType(**exp_type) for exp_type in AVAILABLE_EXPERIMENT_TYPES]
-    return {"experiment_types": experiment_types} 
\ No newline at end of file
+    return _cached_response(request, _EXPERIMENT_TYPES_BYTES, _EXPERIMENT_TYPES_ETAG)
@@ -15,8 +15,15 @@ BASE_DIR = Path(__file__).resolve().parent
 API_V1_STR = "/api/v1"
 PROJECT_NAME = "Quantum Lab API"
 
-# Database settings - using SQLite for simplicity
-DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{BASE_DIR}/quantum_lab.db")
+# Database settings - SQLite via aiosqlite by default; the URL must name an async driver
+DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite+aiosqlite:///{BASE_DIR}/quantum_lab.db")
+
+# Response cache settings - Redis is used when REDIS_URL is set; without it the
+# cache is per-process, so multi-worker deployments must set REDIS_URL
+REDIS_URL = os.getenv("REDIS_URL", "")
+CACHE_TTL = int(os.getenv("CACHE_TTL", "60"))
+# How long a finished background run's status stays queryable, in seconds
+JOB_STATUS_TTL = int(os.getenv("JOB_STATUS_TTL", "3600"))
 
 # CORS settings
 BACKEND_CORS_ORIGINS = [
@@ -25,9 +32,15 @@ BACKEND_CORS_ORIGINS = [
     "http://127.0.0.1:3000",
     "http://127.0.0.1:8000",
 ]
+# Deployed frontend origin, if any
+FRONTEND_URL = os.getenv("FRONTEND_URL", "")
+if FRONTEND_URL:
+    BACKEND_CORS_ORIGINS.append(FRONTEND_URL)
 
 # Quantum settings
 QISKIT_RUNTIME_TOKEN = os.getenv("QISKIT_RUNTIME_TOKEN", "")
+# Maximum number of experiments computed at the same time
+QUANTUM_MAX_JOBS = int(os.getenv("QUANTUM_MAX_JOBS", "2"))
 
 # Default quantum systems available - these match the MockQuantumAdapter
 AVAILABLE_SYSTEMS = [
@@ -53,4 +66,9 @@ AVAILABLE_EXPERIMENT_TYPES = [
     {"id": "geometry", "name": "Geometry Optimization", "description": "Optimize molecular geometry"},
     {"id": "vibrational", "name": "Vibrational Analysis", "description": "Calculate vibrational frequencies"},
     {"id": "dipole", "name": "Dipole Moment", "description": "Calculate molecular dipole moment"}
-] 
\ No newline at end of file
+] 
+
+# Lookup tables keyed by ID, built once for O(1) access in request handlers
+SYSTEMS_BY_ID = {s["id"]: s for s in AVAILABLE_SYSTEMS}
+BASIS_SETS_BY_ID = {b["id"]: b for b in AVAILABLE_BASIS_SETS}
+EXPERIMENT_TYPES_BY_ID = {e["id"]: e for e in AVAILABLE_EXPERIMENT_TYPES}
@@ -2,45 +2,74 @@
 SQLAlchemy models for database tables.
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, ForeignKey
+import orjson
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Index, Text, text
 from sqlalchemy.orm import relationship
-import sys
-import os
+from sqlalchemy.types import TypeDecorator
 
-# Add the parent directory to path so we can import from db
-sys.path.append(os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
-from db.database import Base
+from .database import Base
+
+
+class OrjsonJSON(TypeDecorator):
+    """JSON column stored as compact TEXT and (de)serialized with orjson."""
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return orjson.loads(value)
 
 
 class Experiment(Base):
     """Model for quantum experiments."""
     __tablename__ = "experiments"
+    __table_args__ = (
+        # Covers filtering by system/type ordered by creation time
+        Index("ix_exp_system_type_created", "system_id", "experiment_type", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True)
     system_id = Column(String, index=True)
     basis_set = Column(String)
     experiment_type = Column(String)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    configuration = Column(JSON)  # Store experiment configurations as JSON
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    configuration = Column(OrjsonJSON)  # Store experiment configurations as JSON
     
     # Relationship to results
-    results = relationship("ExperimentResult", back_populates="experiment", cascade="all, delete-orphan")
+    results = relationship(
+        "ExperimentResult",
+        back_populates="experiment",
+        cascade="all, delete-orphan",
+        order_by="desc(ExperimentResult.id)",
+    )
 
 
 class ExperimentResult(Base):
     """Model for experiment results."""
     __tablename__ = "experiment_results"
+    __table_args__ = (
+        # Covers the FK lookup and lets per-experiment listings walk in time order
+        Index("ix_result_experiment_created", "experiment_id", "created_at"),
+        # Serves newest-first keyset pages of one experiment's results
+        Index("ix_result_experiment_id_desc", "experiment_id", text("id DESC")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     experiment_id = Column(Integer, ForeignKey("experiments.id"))
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
     energy = Column(Float)  # Ground state energy result
     reference_energy = Column(Float, nullable=True)  # Reference value if available
     iterations = Column(Integer)  # Number of iterations performed
     runtime = Column(Float)  # Runtime in seconds
     convergence = Column(Float, nullable=True)  # Convergence metric
-    data = Column(JSON)  # Any additional data as JSON
+    data = Column(OrjsonJSON)  # Any additional data as JSON
     
-    # Relationship to experiment
-    experiment = relationship("Experiment", back_populates="results") 
\ No newline at end of file
+    # Relationship to experiment; queries that need it must eager-load it explicitly
+    experiment = relationship("Experiment", back_populates="results", lazy="raise") 
\ No newline at end of file
@@ -1,32 +1,95 @@
 """
 Quantum computation manager to coordinate different quantum modules.
 """
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 import time
 import logging
-import sys
-import os
-
-# Add the parent directory to path so we can import modules
-sys.path.append(os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
 
 # Try to import the real qiskit adapter, fall back to mock adapter
 try:
-    from quantum.modules.qiskit_adapter import QiskitAdapter
+    from .modules.qiskit_adapter import QiskitAdapter
     USING_MOCK = False
     logger = logging.getLogger(__name__)
     logger.info("Using real Qiskit adapter")
 except ImportError:
-    from quantum.modules.mock_adapter import MockQuantumAdapter
+    from .modules.mock_adapter import MockQuantumAdapter
     USING_MOCK = True
     logger = logging.getLogger(__name__)
     logger.warning("Using mock adapter instead of real Qiskit adapter")
 
-from quantum.modules.antimatter import AntimatterSimulator
+from .modules.antimatter import AntimatterSimulator
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Map API experiment types to mock adapter experiment types
+_EXPERIMENT_TYPE_MAP = {
+    "ground": "ground_state",
+    "excited": "excited_state",
+    "geometry": "geometry_optimization",
+    "vibrational": "vibrational_analysis",
+    "dipole": "dipole_moment"
+}
+
+
+# Generic estimate adjustments, keyed by lower-cased system ID and upper-cased
+# algorithm/ansatz names
+# System: (qubit delta, depth delta, runtime estimate override)
+_SYSTEM_ADJ = {
+    "h2o": (6, 30, "10-30 seconds"),
+    "lih": (6, 30, "10-30 seconds"),
+    "h2": (2, 10, None),
+    "h": (1, 0, None),
+    "he": (1, 0, None),
+    "li": (1, 0, None),
+}
+# Algorithm: (qubit multiplier, depth multiplier, runtime estimate override)
+_ALGO_ADJ = {
+    "VQE": (1, 1.5, None),
+    "QAOA": (1, 2, None),
+    "QPE": (2, 3, "30-60 seconds"),
+}
+# Ansatz: (qubit delta, depth multiplier, depth delta)
+_ANSATZ_ADJ = {
+    "UCCSD": (2, 2, 0),
+    "HWE": (0, 1, 10),
+}
+
+
+@lru_cache(maxsize=512)
+def _estimate(system_id: str, algorithm: str, ansatz: str) -> Tuple[int, int, str]:
+    """
+    Generic resource estimate from the system, algorithm and ansatz.
+    
+    Arguments are expected lower-cased (system_id) and upper-cased (algorithm, ansatz).
+    
+    Returns:
+        Tuple of (qubits, depth, runtime estimate)
+    """
+    qubits = 2
+    depth = 10
+    runtime_estimate = "2-5 seconds"
+    
+    # Adjust based on system
+    qubit_delta, depth_delta, runtime = _SYSTEM_ADJ.get(system_id, (0, 0, None))
+    qubits += qubit_delta
+    depth += depth_delta
+    runtime_estimate = runtime or runtime_estimate
+    
+    # Adjust based on algorithm
+    qubit_mult, depth_mult, runtime = _ALGO_ADJ.get(algorithm, (1, 1, None))
+    qubits *= qubit_mult
+    depth *= depth_mult
+    runtime_estimate = runtime or runtime_estimate
+    
+    # Adjust based on ansatz
+    qubit_delta, depth_mult, depth_delta = _ANSATZ_ADJ.get(ansatz, (0, 1, 0))
+    qubits += qubit_delta
+    depth = depth * depth_mult + depth_delta
+    
+    return int(qubits), int(depth), runtime_estimate
+
 
 class QuantumModuleManager:
     """
@@ -37,8 +100,17 @@ class QuantumModuleManager:
     # Initialize the adapter
     if USING_MOCK:
         _adapter = MockQuantumAdapter()
+        # Mock systems keyed by lower-cased ID for constant-time lookups
+        _SYSTEMS_BY_ID = {system["id"].lower(): system for system in _adapter.SYSTEMS}
     else:
         _adapter = QiskitAdapter
+        _SYSTEMS_BY_ID = {}
+    
+    @staticmethod
+    def warm_up(qubit_counts: Iterable[int]) -> None:
+        """Prepare the adapter's reusable circuits and estimators ahead of the first run."""
+        if not USING_MOCK:
+            QuantumModuleManager._adapter.warm_up(qubit_counts)
     
     @staticmethod
     def estimate_resources(system_id: str, configuration: Dict[str, Any]) -> Dict[str, Any]:
@@ -55,12 +127,7 @@ class QuantumModuleManager:
         if USING_MOCK:
             # Get molecule data from mock adapter
             try:
-                for system in QuantumModuleManager._adapter.SYSTEMS:
-                    if system["id"].lower() == system_id.lower():
-                        molecule_data = system
-                        break
-                else:
-                    molecule_data = None
+                molecule_data = QuantumModuleManager._SYSTEMS_BY_ID.get(system_id.lower())
                 
                 if molecule_data:
                     # Use the mock adapter's resource estimation
@@ -73,44 +140,14 @@ class QuantumModuleManager:
                 logger.error(f"Error in mock resource estimation: {str(e)}")
         
         # Fallback to generic resource estimation
-        qubits = 2
-        depth = 10
-        runtime_estimate = "2-5 seconds"
-        
-        # Adjust based on system
-        if system_id.lower() in ["h2o", "lih"]:
-            qubits += 6
-            depth += 30
-            runtime_estimate = "10-30 seconds"
-        elif system_id.lower() in ["h2"]:
-            qubits += 2
-            depth += 10
-        elif system_id.lower() in ["h", "he", "li"]:
-            qubits += 1
-            
-        # Adjust based on algorithm
-        algorithm = configuration.get("algorithm", "").upper()
-        if algorithm == "VQE":
-            depth *= 1.5
-        elif algorithm == "QAOA":
-            depth *= 2
-        elif algorithm == "QPE":
-            qubits *= 2
-            depth *= 3
-            runtime_estimate = "30-60 seconds"
-            
-        # Adjust based on ansatz
-        ansatz = configuration.get("ansatz", "").upper()
-        if ansatz == "UCCSD":
-            qubits += 2
-            depth *= 2
-        elif ansatz == "HWE":
-            depth += 10
-            
-        # Return estimates
+        qubits, depth, runtime_estimate = _estimate(
+            system_id.lower(),
+            configuration.get("algorithm", "").upper(),
+            configuration.get("ansatz", "").upper()
+        )
         return {
-            "qubits": int(qubits),
-            "depth": int(depth),
+            "qubits": qubits,
+            "depth": depth,
             "runtime": runtime_estimate
         }
     
@@ -134,7 +171,7 @@ class QuantumModuleManager:
             Dictionary with experiment results
         """
         logger.info(f"Running experiment for system {system_id} with basis {basis_set}")
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Check for antimatter systems
@@ -150,22 +187,12 @@ class QuantumModuleManager:
             # For mock adapter, handle differently
             elif USING_MOCK:
                 # Get molecule data from system_id
-                for system in QuantumModuleManager._adapter.SYSTEMS:
-                    if system["id"].lower() == system_id.lower():
-                        molecule_data = system
-                        break
-                else:
+                molecule_data = QuantumModuleManager._SYSTEMS_BY_ID.get(system_id.lower())
+                if molecule_data is None:
                     raise ValueError(f"Unknown system ID: {system_id}")
                 
                 # Map experiment types
-                experiment_map = {
-                    "ground": "ground_state",
-                    "excited": "excited_state",
-                    "geometry": "geometry_optimization",
-                    "vibrational": "vibrational_analysis",
-                    "dipole": "dipole_moment"
-                }
-                mock_experiment_type = experiment_map.get(experiment_type, experiment_type)
+                mock_experiment_type = _EXPERIMENT_TYPE_MAP.get(experiment_type, experiment_type)
                 
                 # Run with mock adapter
                 result = QuantumModuleManager._adapter.run_experiment(
@@ -186,14 +213,16 @@ class QuantumModuleManager:
                     result = QuantumModuleManager._adapter.calculate_ground_state(
                         system_id=system_id,
                         basis_set=basis_set,
-                        configuration=configuration
+                        configuration=configuration,
+                        num_restarts=configuration.get("num_restarts", 1)
                     )
                 elif experiment_type == "excited":
                     # For now, just return ground state with a message
                     result = QuantumModuleManager._adapter.calculate_ground_state(
                         system_id=system_id,
                         basis_set=basis_set,
-                        configuration=configuration
+                        configuration=configuration,
+                        num_restarts=configuration.get("num_restarts", 1)
                     )
                     result["data"]["message"] = "Excited state calculation not yet implemented, showing ground state instead"
                 else:
@@ -213,5 +242,5 @@ class QuantumModuleManager:
                 "system_id": system_id,
                 "basis_set": basis_set,
                 "experiment_type": experiment_type,
-                "runtime": time.time() - start_time
+                "runtime": (time.perf_counter_ns() - start_ns) * 1e-9
             } 
\ No newline at end of file
@@ -1,10 +1,41 @@
 """
 Custom antimatter simulation module.
 """
+import random
 import time
-import numpy as np
 from typing import Dict, Any, List, Optional
 
+from ...utils.jit import njit
+
+# Conversion constants, folded once instead of divided on every call
+_INV_HARTREE = 1.0 / 27.211386  # Hartree per eV
+_E1_EV = -13.6  # Hydrogen-like ground state energy in eV
+_E1_HARTREE = _E1_EV * _INV_HARTREE
+
+
+@njit(cache=True, fastmath=True)
+def _positronium_kernel(n, reference_energy):
+    """Return (binding energy in eV, energy in Hartree, iterations, convergence)."""
+    inv_n2 = 1.0 / (n * n)
+    binding_energy = _E1_EV * inv_n2
+    energy_hartree = _E1_HARTREE * inv_n2
+    iterations = random.randint(50, 149)
+    convergence = abs(energy_hartree - reference_energy)
+    return binding_energy, energy_hartree, iterations, convergence
+
+
+@njit(cache=True, fastmath=True)
+def _antihydrogen_kernel(n, reference_energy):
+    """Return (energy in eV, energy in Hartree, iterations, convergence, CPT violation)."""
+    inv_n2 = 1.0 / (n * n)
+    energy_ev = _E1_EV * inv_n2
+    # Add a tiny CPT violation for demonstration (this is fictional)
+    cpt_violation = random.gauss(0.0, 1e-7)
+    energy_hartree = _E1_HARTREE * inv_n2 + cpt_violation
+    iterations = random.randint(30, 99)
+    convergence = abs(energy_hartree - reference_energy)
+    return energy_ev, energy_hartree, iterations, convergence, cpt_violation
+
 
 class AntimatterSimulator:
     """
@@ -25,7 +56,7 @@ class AntimatterSimulator:
         Returns:
             Dictionary with simulation results
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # In a real implementation, this would use more sophisticated calculations
         # For demonstration, we'll use simplified formulas
@@ -33,21 +64,13 @@ class AntimatterSimulator:
         # Reduced mass of electron-positron system
         reduced_mass = 0.5  # In electron masses
         
-        # Binding energy calculation (simplified)
         n = 1  # Principal quantum number
-        binding_energy = -13.6 / (n * n)  # Energy in eV
-        
-        # Convert to Hartree for consistency
-        energy_hartree = binding_energy / 27.211386
         
         # Theoretical value with corrections
         reference_energy = -0.25  # Hartree
         
-        # Simulate some iterations
-        iterations = np.random.randint(50, 150)
-        
-        # Simulate convergence
-        convergence = abs(energy_hartree - reference_energy)
+        # Binding energy (eV, converted to Hartree), iterations and convergence
+        binding_energy, energy_hartree, iterations, convergence = _positronium_kernel(n, reference_energy)
         
         # Simulation data
         data = {
@@ -60,7 +83,7 @@ class AntimatterSimulator:
         }
         
         # Calculate runtime
-        runtime = time.time() - start_time
+        runtime = (time.perf_counter_ns() - start_ns) * 1e-9
         
         return {
             "energy": energy_hartree,
@@ -82,30 +105,20 @@ class AntimatterSimulator:
         Returns:
             Dictionary with simulation results
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # Energy levels should be same as hydrogen due to CPT symmetry
         # But we'll add a small difference for demonstration purposes
         
-        # Ground state energy calculation
         n = 1  # Principal quantum number
-        energy_ev = -13.6 / (n * n)  # Energy in eV
-        
-        # Convert to Hartree for consistency
-        energy_hartree = energy_ev / 27.211386
-        
-        # Add a tiny CPT violation for demonstration (this is fictional)
-        cpt_violation = np.random.normal(0, 1e-7)
-        energy_hartree += cpt_violation
         
         # Theoretical value
         reference_energy = -0.5  # Hartree
         
-        # Simulate some iterations
-        iterations = np.random.randint(30, 100)
-        
-        # Simulate convergence
-        convergence = abs(energy_hartree - reference_energy)
+        # Ground state energy (eV, converted to Hartree) including the CPT violation
+        energy_ev, energy_hartree, iterations, convergence, cpt_violation = _antihydrogen_kernel(
+            n, reference_energy
+        )
         
         # Simulation data
         data = {
@@ -117,7 +130,7 @@ class AntimatterSimulator:
         }
         
         # Calculate runtime
-        runtime = time.time() - start_time
+        runtime = (time.perf_counter_ns() - start_ns) * 1e-9
         
         return {
             "energy": energy_hartree,
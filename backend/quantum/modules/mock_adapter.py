@@ -3,20 +3,169 @@ Mock adapter for quantum chemistry calculations.
 This adapter simulates running quantum chemistry calculations without
 actually using real quantum computing resources.
 """
+import asyncio
+import copy
 import json
 import logging
-import random
 import time
+import zlib
+from bisect import bisect_right
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from ...utils.jit import njit
 
 logger = logging.getLogger(__name__)
 
+# Atomic numbers (electron counts of neutral atoms) for the first 18 elements
+_ELEMENT_Z = {
+    "H": 1, "He": 2, "Li": 3, "Be": 4, "B": 5, "C": 6, "N": 7, "O": 8, "F": 9, "Ne": 10,
+    "Na": 11, "Mg": 12, "Al": 13, "Si": 14, "P": 15, "S": 16, "Cl": 17, "Ar": 18
+}
+
+# Orbital symmetry labels sampled for mock orbitals
+_ORBITAL_SYMMETRIES = ["A1", "A2", "B1", "B2"]
+
+# Basis set factors for the simulated wall-clock delay
+_BASIS_TIME_FACTORS = {
+    "sto-3g": 0.1,
+    "3-21g": 0.2,
+    "6-31g": 0.3,
+    "cc-pvdz": 0.5,
+    "cc-pvtz": 1.0
+}
+
+# Basis set factors for the reported runtime
+_BASIS_RUNTIME_FACTORS = {
+    "sto-3g": 1.0,
+    "3-21g": 2.0,
+    "6-31g": 3.0,
+    "cc-pvdz": 5.0,
+    "cc-pvtz": 10.0
+}
+
+# Total simulated-latency factor per experiment type, including nested calculations
+# (e.g. an excited state run performs a ground state run first)
+_LATENCY_FACTORS = {
+    "ground_state": 1.0,
+    "excited_state": 2.5,
+    "geometry_optimization": 2.0,
+    "vibrational_analysis": 4.5,
+    "dipole_moment": 1.5
+}
+
+# Complexity factors used for resource estimates
+_BASIS_COMPLEXITY = {
+    "sto-3g": 1.0,
+    "3-21g": 2.0,
+    "6-31g": 3.0,
+    "cc-pvdz": 4.0,
+    "cc-pvtz": 8.0
+}
+_EXPERIMENT_COMPLEXITY = {
+    "ground_state": 1.0,
+    "excited_state": 2.5,
+    "geometry_optimization": 3.0,
+    "vibrational_analysis": 5.0,
+    "dipole_moment": 1.2
+}
+
+# Upper bounds in seconds for each display unit below, and the (divisor, unit) pairs
+_TIME_THRESHOLDS = (60, 3600, 86400)
+_TIME_UNITS = ((1, "seconds"), (60, "minutes"), (3600, "hours"), (86400, "days"))
+
+# Hartree to electronvolt conversion
+HARTREE_TO_EV = 27.2114
+
+# Zero-point energy scale: half the summed real frequencies, converted to kcal/mol
+_ZPE_FACTOR = 0.5 / 4184.0
+
+
+@njit(cache=True)
+def _calc_runtime_core(num_atoms, basis_factor, factor, r):
+    """Return the reported runtime in seconds for a noise draw r in [0, 0.4)."""
+    return num_atoms * num_atoms * basis_factor * factor * (0.8 + r)
+
+
+@njit(cache=True)
+def _resource_core(num_electrons, basis_factor, experiment_factor):
+    """Return rounded (memory MB, disk MB, CPU hours, runtime seconds) estimates."""
+    scale = num_electrons * num_electrons * basis_factor * experiment_factor
+    memory_mb = scale * 0.1
+    disk_mb = memory_mb * 5
+    cpu_hours = scale * 0.01
+    runtime_sec = cpu_hours * 3600 / 8  # Assuming 8 cores
+    return round(memory_mb, 2), round(disk_mb, 2), round(cpu_hours, 2), round(runtime_sec, 2)
+
+
+def _key_seed(*parts: Any) -> int:
+    """Derive a stable RNG seed from a cache key."""
+    return zlib.crc32("|".join(map(str, parts)).encode())
+
+
+def _iso(timestamp: float) -> str:
+    """Format an epoch timestamp as a local ISO 8601 string."""
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
+def _orbitals_to_dicts(energies: np.ndarray, occupations: np.ndarray, symmetries: np.ndarray) -> List[Dict[str, Any]]:
+    """Expand compact orbital arrays into the per-orbital dict layout."""
+    return [
+        {"index": i, "energy": energy, "occupation": occupation, "symmetry": symmetry}
+        for i, (energy, occupation, symmetry) in enumerate(zip(
+            energies.tolist(), occupations.tolist(), symmetries.tolist()
+        ))
+    ]
+
+
+def _vibrations_to_dicts(
+    frequencies: np.ndarray,
+    intensities: np.ndarray,
+    reduced_masses: np.ndarray,
+    force_constants: np.ndarray,
+    displacements: np.ndarray
+) -> List[Dict[str, Any]]:
+    """Expand compact vibration arrays, with (modes, atoms, 3) displacements, into per-mode dicts."""
+    return [
+        {
+            "mode": i + 1,
+            "frequency": frequency,
+            "intensity": intensity,
+            "reduced_mass": reduced_mass,
+            "force_constant": force_constant,
+            "displacements": [
+                {"atom": j, "dx": dx, "dy": dy, "dz": dz}
+                for j, (dx, dy, dz) in enumerate(mode_displacements)
+            ]
+        }
+        for i, (frequency, intensity, reduced_mass, force_constant, mode_displacements) in enumerate(zip(
+            frequencies.tolist(),
+            intensities.tolist(),
+            reduced_masses.tolist(),
+            force_constants.tolist(),
+            displacements.tolist()
+        ))
+    ]
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
 class MockQuantumAdapter:
     """Mock adapter for quantum chemistry calculations."""
     
-    # Mock molecular systems data
-    SYSTEMS = [
+    # Mock molecular systems data, frozen so shared references cannot be mutated
+    SYSTEMS = _freeze([
         {
             "id": "h2o",
             "name": "Water",
@@ -68,29 +217,46 @@ class MockQuantumAdapter:
             "charge": 0,
             "multiplicity": 1
         }
-    ]
+    ])
+    _SYSTEMS_BY_ID = {system["id"]: system for system in SYSTEMS}
+    _TOTAL_ELECTRONS = {
+        system["id"]: sum(_ELEMENT_Z.get(atom["symbol"], 6) for atom in system["atoms"])
+        for system in SYSTEMS
+    }
     
     # Mock basis sets
-    BASIS_SETS = [
+    BASIS_SETS = _freeze([
         {"id": "sto-3g", "name": "STO-3G", "description": "Minimal basis set"},
         {"id": "3-21g", "name": "3-21G", "description": "Split valence basis set"},
         {"id": "6-31g", "name": "6-31G", "description": "Split valence basis set"},
         {"id": "cc-pvdz", "name": "cc-pVDZ", "description": "Correlation consistent polarized valence double zeta basis set"},
         {"id": "cc-pvtz", "name": "cc-pVTZ", "description": "Correlation consistent polarized valence triple zeta basis set"}
-    ]
+    ])
     
     # Mock experiment types
-    EXPERIMENT_TYPES = [
+    EXPERIMENT_TYPES = _freeze([
         {"id": "ground_state", "name": "Ground State", "description": "Calculate ground state energy"},
         {"id": "excited_state", "name": "Excited State", "description": "Calculate excited state properties"},
         {"id": "geometry_optimization", "name": "Geometry Optimization", "description": "Optimize molecular geometry"},
         {"id": "vibrational_analysis", "name": "Vibrational Analysis", "description": "Calculate vibrational frequencies"},
         {"id": "dipole_moment", "name": "Dipole Moment", "description": "Calculate molecular dipole moment"}
-    ]
+    ])
 
-    def __init__(self):
-        """Initialize the mock adapter."""
+    def __init__(self, simulate_latency: bool = False, seed: Optional[int] = None):
+        """
+        Initialize the mock adapter.
+        
+        Args:
+            simulate_latency: Sleep for a size-dependent time on each calculation
+                to mimic a real backend. Off by default so results return instantly.
+            seed: Seed for this adapter's random generator, for reproducible results
+        """
         logger.info("Initializing MockQuantumAdapter")
+        self.simulate_latency = simulate_latency
+        self._rng = np.random.default_rng(seed)
+        
+        # Atom coordinate arrays keyed by system ID, parsed on first use
+        self._coords_cache: Dict[str, np.ndarray] = {}
         
         # Mock reference data for energy values (in hartree)
         self.reference_energies = {
@@ -123,71 +289,112 @@ class MockQuantumAdapter:
                 "cc-pvtz": -187.968
             }
         }
+        # Flattened (system_id, basis_set) -> energy for single-lookup access
+        self._ref = {
+            (system_id, basis): energy
+            for system_id, energies in self.reference_energies.items()
+            for basis, energy in energies.items()
+        }
 
-    def get_available_systems(self) -> List[Dict[str, Any]]:
+    def get_available_systems(self) -> Tuple[Mapping[str, Any], ...]:
         """Get available molecular systems."""
         return self.SYSTEMS
     
-    def get_available_basis_sets(self) -> List[Dict[str, Any]]:
+    def get_available_basis_sets(self) -> Tuple[Mapping[str, Any], ...]:
         """Get available basis sets."""
         return self.BASIS_SETS
     
-    def get_available_experiment_types(self) -> List[Dict[str, Any]]:
+    def get_available_experiment_types(self) -> Tuple[Mapping[str, Any], ...]:
         """Get available experiment types."""
         return self.EXPERIMENT_TYPES
 
-    def get_molecule_data(self, system_id: str) -> Dict[str, Any]:
+    def get_molecule_data(self, system_id: str) -> Mapping[str, Any]:
         """Get molecule data for a given system ID."""
-        for system in self.SYSTEMS:
-            if system["id"] == system_id:
-                return system
-        raise ValueError(f"Unknown system ID: {system_id}")
+        try:
+            return self._SYSTEMS_BY_ID[system_id]
+        except KeyError:
+            raise ValueError(f"Unknown system ID: {system_id}")
     
-    def run_ground_state_calculation(self, molecule_data: Dict[str, Any], basis_set: str, **kwargs) -> Dict[str, Any]:
-        """Run a ground state energy calculation."""
+    def run_ground_state_calculation(
+        self, molecule_data: Dict[str, Any], basis_set: str, compact: bool = False, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Run a ground state energy calculation.
+        
+        With compact=True, orbitals are returned as "orbital_energies", "orbital_occupations"
+        and "orbital_symmetries" arrays instead of a list of per-orbital dicts.
+        """
         logger.info(f"Running ground state calculation for {molecule_data['name']} with {basis_set}")
         
         # Simulate calculation time
         self._simulate_calculation_time(molecule_data, basis_set)
         
-        # Get reference energy from our mock data
-        system_id = molecule_data["id"]
-        reference_energy = self.reference_energies.get(system_id, {}).get(basis_set)
-        
+        return self._ground_state_batch(molecule_data, basis_set, 1, compact)[0]
+    
+    def _ground_state_batch(
+        self, molecule_data: Dict[str, Any], basis_set: str, count: int, compact: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Generate `count` ground state results on the cached core, drawing per-run noise in one call."""
+        reference_energy, orbital_energies, occupations, symmetries = self._ground_state_core(
+            molecule_data["id"], basis_set, len(molecule_data["atoms"]), self._ref.get((molecule_data["id"], basis_set))
+        )
+        
+        # Per-run decorations on top of the shared core; the energy noise simulates
+        # slightly different results on every run
+        energies = (reference_energy + self._rng.uniform(-0.001, 0.001, count)).tolist()
+        iterations = self._rng.integers(10, 31, count).tolist()
+        dipole_moments = self._rng.uniform(-0.5, 0.5, (count, 3)).tolist()
+        timestamp = time.time()
+        
+        results = []
+        for run in range(count):
+            result = {
+                "energy": energies[run],
+                "reference_energy": reference_energy,
+                "iterations": iterations[run],
+                "runtime": self._calculate_runtime(molecule_data, basis_set),
+                "converged": True,
+                "dipole_moment": dipole_moments[run],
+                "method": "RHF",
+                "basis_set": basis_set,
+                "timestamp_epoch": timestamp
+            }
+            if compact:
+                # Shared read-only arrays from the cached core
+                result["orbital_energies"] = orbital_energies
+                result["orbital_occupations"] = occupations
+                result["orbital_symmetries"] = symmetries
+            else:
+                result["orbitals"] = _orbitals_to_dicts(orbital_energies, occupations, symmetries)
+            results.append(result)
+        return results
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _ground_state_core(
+        system_id: str, basis_set: str, num_atoms: int, reference_energy: Optional[float]
+    ) -> Tuple[float, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return (reference energy, orbital energies, occupations, symmetries).
+        
+        Draws come from an RNG seeded by the key, so these are fixed per system and basis
+        and shared by dependent experiments and repeated runs; per-run energy noise is
+        added by the caller. The orbital arrays are read-only.
+        """
+        rng = np.random.default_rng(_key_seed("ground_state", system_id, basis_set, num_atoms))
         if reference_energy is None:
             # If we don't have reference data, generate a plausible value
-            reference_energy = -50.0 - (len(molecule_data["atoms"]) * 10.0) + random.uniform(-0.5, 0.5)
-        
-        # Add some random noise to simulate slightly different results
-        energy = reference_energy + random.uniform(-0.001, 0.001)
-        
-        # Generate orbitals data
-        num_orbitals = len(molecule_data["atoms"]) * 2
-        orbitals = [
-            {
-                "index": i,
-                "energy": -10.0 + i * 0.5 + random.uniform(-0.01, 0.01),
-                "occupation": 2.0 if i < num_orbitals // 2 else 0.0,
-                "symmetry": random.choice(["A1", "A2", "B1", "B2"])
-            }
-            for i in range(num_orbitals)
-        ]
-        
-        # Calculate run time
-        run_time = self._calculate_runtime(molecule_data, basis_set)
-        
-        return {
-            "energy": energy,
-            "reference_energy": reference_energy,
-            "iterations": random.randint(10, 30),
-            "runtime": run_time,
-            "orbitals": orbitals,
-            "converged": True,
-            "dipole_moment": [random.uniform(-0.5, 0.5), random.uniform(-0.5, 0.5), random.uniform(-0.5, 0.5)],
-            "method": "RHF",
-            "basis_set": basis_set,
-            "timestamp": datetime.now().isoformat()
-        }
+            reference_energy = -50.0 - num_atoms * 10.0 + rng.uniform(-0.5, 0.5)
+        
+        # Generate orbitals data with one batched draw per quantity
+        num_orbitals = num_atoms * 2
+        indices = np.arange(num_orbitals)
+        orbital_energies = -10.0 + indices * 0.5 + rng.uniform(-0.01, 0.01, num_orbitals)
+        occupations = np.where(indices < num_orbitals // 2, 2.0, 0.0)
+        symmetries = rng.choice(_ORBITAL_SYMMETRIES, num_orbitals)
+        for array in (orbital_energies, occupations, symmetries):
+            array.flags.writeable = False
+        return reference_energy, orbital_energies, occupations, symmetries
     
     def run_excited_state_calculation(self, molecule_data: Dict[str, Any], basis_set: str, **kwargs) -> Dict[str, Any]:
         """Run an excited state calculation."""
@@ -202,26 +409,34 @@ class MockQuantumAdapter:
         # Number of excited states to calculate (default to 3)
         num_states = kwargs.get("num_states", 3)
         
-        # Generate excited states
-        excited_states = []
-        for i in range(num_states):
-            # Excitation energy increases with state number
-            excitation_energy = (i + 1) * 0.1 + random.uniform(-0.02, 0.02)
-            
-            # Total energy is ground state plus excitation
-            total_energy = ground_state["energy"] + excitation_energy
-            
-            # Generate oscillator strength (probability of transition)
-            oscillator_strength = random.uniform(0.01, 1.0)
-            
-            excited_states.append({
-                "state": i + 1,
-                "excitation_energy_ev": excitation_energy * 27.2114,  # Convert to eV
+        # Generate excited states, drawing each quantity for all states at once
+        states = np.arange(1, num_states + 1)
+        # Excitation energy increases with state number
+        excitation_energies = states * 0.1 + self._rng.uniform(-0.02, 0.02, num_states)
+        # Total energy is ground state plus excitation
+        total_energies = ground_state["energy"] + excitation_energies
+        # Generate oscillator strength (probability of transition)
+        oscillator_strengths = self._rng.uniform(0.01, 1.0, num_states)
+        weights = self._rng.uniform(0.7, 0.95, num_states)
+        
+        excited_states = [
+            {
+                "state": state,
+                "excitation_energy_ev": excitation_energy_ev,
                 "excitation_energy": excitation_energy,
                 "total_energy": total_energy,
                 "oscillator_strength": oscillator_strength,
-                "description": f"HOMO->{i} ({random.uniform(0.7, 0.95):.2f})"
-            })
+                "description": f"HOMO->{state - 1} ({weight:.2f})"
+            }
+            for state, excitation_energy, excitation_energy_ev, total_energy, oscillator_strength, weight in zip(
+                states.tolist(),
+                excitation_energies.tolist(),
+                (excitation_energies * HARTREE_TO_EV).tolist(),
+                total_energies.tolist(),
+                oscillator_strengths.tolist(),
+                weights.tolist()
+            )
+        ]
         
         # Calculate run time
         run_time = self._calculate_runtime(molecule_data, basis_set, factor=1.5)
@@ -229,13 +444,13 @@ class MockQuantumAdapter:
         return {
             "energy": ground_state["energy"],
             "reference_energy": ground_state["reference_energy"],
-            "iterations": random.randint(15, 45),
+            "iterations": int(self._rng.integers(15, 46)),
             "runtime": run_time,
             "excited_states": excited_states,
             "ground_state_data": ground_state,
             "method": "TD-RHF",
             "basis_set": basis_set,
-            "timestamp": datetime.now().isoformat()
+            "timestamp_epoch": time.time()
         }
     
     def run_geometry_optimization(self, molecule_data: Dict[str, Any], basis_set: str, **kwargs) -> Dict[str, Any]:
@@ -245,47 +460,46 @@ class MockQuantumAdapter:
         # Simulate calculation time (geometry optimizations take longer)
         self._simulate_calculation_time(molecule_data, basis_set, factor=2.0)
         
-        # Get reference energy
-        system_id = molecule_data["id"]
-        reference_energy = self.reference_energies.get(system_id, {}).get(basis_set)
-        
-        if reference_energy is None:
-            # If we don't have reference data, generate a plausible value
-            reference_energy = -50.0 - (len(molecule_data["atoms"]) * 10.0) + random.uniform(-0.5, 0.5)
+        reference_energy, shifts = self._geometry_core(
+            molecule_data["id"], basis_set, len(molecule_data["atoms"]), self._ref.get((molecule_data["id"], basis_set))
+        )
         
         # Add some random noise to simulate slightly different results
-        energy = reference_energy + random.uniform(-0.001, 0.001)
-        
-        # Create a copy of the molecule's atoms and slightly modify the coordinates
-        optimized_atoms = []
-        for atom in molecule_data["atoms"]:
-            optimized_atoms.append({
-                "symbol": atom["symbol"],
-                "x": atom["x"] + random.uniform(-0.02, 0.02),
-                "y": atom["y"] + random.uniform(-0.02, 0.02),
-                "z": atom["z"] + random.uniform(-0.02, 0.02)
-            })
-        
-        # Simulate optimization steps
-        num_steps = random.randint(5, 15)
-        optimization_steps = []
-        
-        current_energy = energy + random.uniform(0.1, 0.3)  # Start with higher energy
-        
-        for i in range(num_steps):
-            # Energy decreases with each step
-            step_energy = current_energy - (current_energy - energy) * ((i + 1) / num_steps) + random.uniform(-0.001, 0.001)
-            current_energy = step_energy
-            
-            # RMS gradient decreases with each step
-            rms_gradient = 0.1 * (1.0 - (i / num_steps)) + random.uniform(-0.005, 0.005)
-            
-            optimization_steps.append({
-                "step": i + 1,
-                "energy": step_energy,
-                "rms_gradient": rms_gradient,
-                "max_force": rms_gradient * 2 + random.uniform(-0.01, 0.01)
-            })
+        energy = reference_energy + self._rng.uniform(-0.001, 0.001)
+        
+        # Create a copy of the molecule's atoms with the optimized coordinates
+        perturbed = (self._atom_coords(molecule_data) + shifts).tolist()
+        optimized_atoms = [
+            {"symbol": atom["symbol"], "x": x, "y": y, "z": z}
+            for atom, (x, y, z) in zip(molecule_data["atoms"], perturbed)
+        ]
+        
+        # Simulate optimization steps, drawing each noise term for all steps at once
+        num_steps = int(self._rng.integers(5, 16))
+        steps = np.arange(1, num_steps + 1)
+        start_gap = self._rng.uniform(0.1, 0.3)  # Start with higher energy
+        energy_noise = self._rng.uniform(-0.001, 0.001, num_steps)
+        
+        # Energy decreases with each step: the gap to the final energy follows
+        # gap[i + 1] = gap[i] * decay[i] + noise[i], solved with cumulative products.
+        # The last decay factor is zero, so the final step is just its noise.
+        decay = 1.0 - steps / num_steps
+        scale = np.cumprod(decay[:-1])
+        gaps = np.empty(num_steps)
+        gaps[:-1] = scale * (start_gap + np.cumsum(energy_noise[:-1] / scale))
+        gaps[-1] = energy_noise[-1]
+        step_energies = energy + gaps
+        
+        # RMS gradient decreases with each step
+        rms_gradients = 0.1 * (1.0 - (steps - 1) / num_steps) + self._rng.uniform(-0.005, 0.005, num_steps)
+        max_forces = rms_gradients * 2 + self._rng.uniform(-0.01, 0.01, num_steps)
+        
+        optimization_steps = [
+            {"step": step, "energy": step_energy, "rms_gradient": rms_gradient, "max_force": max_force}
+            for step, step_energy, rms_gradient, max_force in zip(
+                steps.tolist(), step_energies.tolist(), rms_gradients.tolist(), max_forces.tolist()
+            )
+        ]
         
         # Calculate run time
         run_time = self._calculate_runtime(molecule_data, basis_set, factor=2.0)
@@ -293,7 +507,7 @@ class MockQuantumAdapter:
         return {
             "energy": energy,
             "reference_energy": reference_energy,
-            "iterations": random.randint(20, 50),
+            "iterations": int(self._rng.integers(20, 51)),
             "runtime": run_time,
             "optimized_geometry": {
                 "atoms": optimized_atoms,
@@ -304,11 +518,37 @@ class MockQuantumAdapter:
             "converged": True,
             "method": "RHF",
             "basis_set": basis_set,
-            "timestamp": datetime.now().isoformat()
+            "timestamp_epoch": time.time()
         }
     
-    def run_vibrational_analysis(self, molecule_data: Dict[str, Any], basis_set: str, **kwargs) -> Dict[str, Any]:
-        """Run a vibrational analysis calculation."""
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _geometry_core(
+        system_id: str, basis_set: str, num_atoms: int, reference_energy: Optional[float]
+    ) -> Tuple[float, np.ndarray]:
+        """
+        Return (reference energy, read-only coordinate shifts) of an optimized geometry.
+        
+        Fixed per key; per-run energy noise is added by the caller.
+        """
+        rng = np.random.default_rng(_key_seed("geometry_optimization", system_id, basis_set, num_atoms))
+        if reference_energy is None:
+            # If we don't have reference data, generate a plausible value
+            reference_energy = -50.0 - num_atoms * 10.0 + rng.uniform(-0.5, 0.5)
+        
+        shifts = rng.uniform(-0.02, 0.02, (num_atoms, 3))
+        shifts.flags.writeable = False
+        return reference_energy, shifts
+    
+    def run_vibrational_analysis(
+        self, molecule_data: Dict[str, Any], basis_set: str, compact: bool = False, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Run a vibrational analysis calculation.
+        
+        With compact=True, modes are returned as "frequencies", "intensities", "reduced_masses",
+        "force_constants" and (modes, atoms, 3) "displacements" arrays instead of per-mode dicts.
+        """
         logger.info(f"Running vibrational analysis for {molecule_data['name']} with {basis_set}")
         
         # First run a geometry optimization
@@ -321,50 +561,43 @@ class MockQuantumAdapter:
         num_atoms = len(molecule_data["atoms"])
         num_modes = 3 * num_atoms - 6
         
-        # Generate vibrations
-        vibrations = []
-        for i in range(num_modes):
-            # Frequencies generally increase with mode number
-            # First few might be very low (or imaginary if saddle point)
-            frequency = (i + 1) * 100 + random.uniform(-50, 50)
-            
-            # Intensities vary considerably
-            intensity = random.uniform(0, 100)
-            
-            # Displacement vectors
-            displacements = []
-            for j in range(num_atoms):
-                displacements.append({
-                    "atom": j,
-                    "dx": random.uniform(-0.1, 0.1),
-                    "dy": random.uniform(-0.1, 0.1),
-                    "dz": random.uniform(-0.1, 0.1)
-                })
-            
-            vibrations.append({
-                "mode": i + 1,
-                "frequency": frequency,
-                "intensity": intensity,
-                "reduced_mass": random.uniform(1.0, 5.0),
-                "force_constant": random.uniform(0.1, 0.5),
-                "displacements": displacements
-            })
+        # Generate vibrations, drawing every random quantity for all modes at once
+        num_modes = max(num_modes, 0)
+        # Frequencies generally increase with mode number
+        # First few might be very low (or imaginary if saddle point)
+        frequencies = np.arange(1, num_modes + 1) * 100 + self._rng.uniform(-50, 50, num_modes)
+        # Intensities vary considerably
+        intensities = self._rng.uniform(0, 100, num_modes)
+        reduced_masses = self._rng.uniform(1.0, 5.0, num_modes)
+        force_constants = self._rng.uniform(0.1, 0.5, num_modes)
+        # Displacement vectors, one (dx, dy, dz) row per atom per mode
+        displacements = self._rng.uniform(-0.1, 0.1, (num_modes, num_atoms, 3))
         
         # Calculate run time
         run_time = self._calculate_runtime(molecule_data, basis_set, factor=2.5)
         
-        return {
+        result = {
             "energy": opt_result["energy"],
             "reference_energy": opt_result["reference_energy"],
-            "iterations": random.randint(30, 70),
+            "iterations": int(self._rng.integers(30, 71)),
             "runtime": run_time,
             "optimized_geometry": opt_result["optimized_geometry"],
-            "vibrations": vibrations,
-            "zero_point_energy": sum(max(0, v["frequency"]) for v in vibrations) * 0.5 / 4.184 / 1000,  # in kcal/mol
+            "zero_point_energy": float(np.maximum(frequencies, 0.0).sum() * _ZPE_FACTOR),  # in kcal/mol
             "method": "RHF",
             "basis_set": basis_set,
-            "timestamp": datetime.now().isoformat()
+            "timestamp_epoch": time.time()
         }
+        if compact:
+            result["frequencies"] = frequencies
+            result["intensities"] = intensities
+            result["reduced_masses"] = reduced_masses
+            result["force_constants"] = force_constants
+            result["displacements"] = displacements
+        else:
+            result["vibrations"] = _vibrations_to_dicts(
+                frequencies, intensities, reduced_masses, force_constants, displacements
+            )
+        return result
     
     def run_dipole_moment(self, molecule_data: Dict[str, Any], basis_set: str, **kwargs) -> Dict[str, Any]:
         """Calculate molecular dipole moment."""
@@ -377,9 +610,7 @@ class MockQuantumAdapter:
         self._simulate_calculation_time(molecule_data, basis_set, factor=0.5)
         
         # Generate dipole components
-        dx = random.uniform(-2.0, 2.0)
-        dy = random.uniform(-2.0, 2.0)
-        dz = random.uniform(-2.0, 2.0)
+        dx, dy, dz = self._rng.uniform(-2.0, 2.0, 3).tolist()
         
         # Total dipole
         total = (dx**2 + dy**2 + dz**2)**0.5
@@ -400,23 +631,112 @@ class MockQuantumAdapter:
             },
             "method": "RHF",
             "basis_set": basis_set,
-            "timestamp": datetime.now().isoformat()
+            "timestamp_epoch": time.time()
         }
     
+    # Experiment type -> calculation method
+    _DISPATCH = {
+        "ground_state": run_ground_state_calculation,
+        "excited_state": run_excited_state_calculation,
+        "geometry_optimization": run_geometry_optimization,
+        "vibrational_analysis": run_vibrational_analysis,
+        "dipole_moment": run_dipole_moment
+    }
+    
+    # Experiment type -> batch generator producing `count` results in one pass
+    _BATCH_DISPATCH = {
+        "ground_state": _ground_state_batch
+    }
+    
     def run_experiment(self, experiment_type: str, molecule_data: Dict[str, Any], basis_set: str, **kwargs) -> Dict[str, Any]:
         """Run an experiment based on its type."""
-        if experiment_type == "ground_state":
-            return self.run_ground_state_calculation(molecule_data, basis_set, **kwargs)
-        elif experiment_type == "excited_state":
-            return self.run_excited_state_calculation(molecule_data, basis_set, **kwargs)
-        elif experiment_type == "geometry_optimization":
-            return self.run_geometry_optimization(molecule_data, basis_set, **kwargs)
-        elif experiment_type == "vibrational_analysis":
-            return self.run_vibrational_analysis(molecule_data, basis_set, **kwargs)
-        elif experiment_type == "dipole_moment":
-            return self.run_dipole_moment(molecule_data, basis_set, **kwargs)
-        else:
+        run = self._DISPATCH.get(experiment_type)
+        if run is None:
             raise ValueError(f"Unknown experiment type: {experiment_type}")
+        return run(self, molecule_data, basis_set, **kwargs)
+
+    def run_experiments(self, specs: List[Tuple[str, str, str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Run a batch of experiments, returning results in input order.
+        
+        Args:
+            specs: (experiment_type, system_id, basis_set, kwargs) tuples
+        
+        Specs sharing an experiment type, system, basis set and compact flag are grouped;
+        types with a batch generator produce the whole group at once, the rest run one by one.
+        """
+        groups: Dict[Tuple[str, str, str, bool], List[int]] = {}
+        for i, (experiment_type, system_id, basis_set, kwargs) in enumerate(specs):
+            if experiment_type not in self._DISPATCH:
+                raise ValueError(f"Unknown experiment type: {experiment_type}")
+            key = (experiment_type, system_id, basis_set, bool(kwargs.get("compact", False)))
+            groups.setdefault(key, []).append(i)
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(specs)
+        for (experiment_type, system_id, basis_set, compact), indices in groups.items():
+            molecule_data = self.get_molecule_data(system_id)
+            batch = self._BATCH_DISPATCH.get(experiment_type)
+            if batch is None:
+                for i in indices:
+                    results[i] = self.run_experiment(experiment_type, molecule_data, basis_set, **specs[i][3])
+                continue
+            
+            # The group shares one simulated calculation
+            self._simulate_calculation_time(molecule_data, basis_set, _LATENCY_FACTORS[experiment_type])
+            for i, result in zip(indices, batch(self, molecule_data, basis_set, len(indices), compact)):
+                results[i] = result
+        return results
+
+    async def run_experiment_async(self, experiment_type: str, molecule_data: Dict[str, Any], basis_set: str, **kwargs) -> Dict[str, Any]:
+        """Run an experiment, awaiting the simulated latency instead of blocking on it."""
+        if experiment_type not in self._DISPATCH:
+            raise ValueError(f"Unknown experiment type: {experiment_type}")
+        if not self.simulate_latency:
+            return self.run_experiment(experiment_type, molecule_data, basis_set, **kwargs)
+        
+        factor = _LATENCY_FACTORS[experiment_type]
+        await asyncio.sleep(self._calculation_delay(molecule_data, basis_set, factor))
+        # Compute on a latency-free view that shares this adapter's data and caches
+        instant = copy.copy(self)
+        instant.simulate_latency = False
+        return instant.run_experiment(experiment_type, molecule_data, basis_set, **kwargs)
+
+    @staticmethod
+    def as_dicts(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a copy of a compact result with orbitals and vibrations in the per-item dict layout."""
+        expanded = dict(result)
+        if "orbital_energies" in expanded:
+            expanded["orbitals"] = _orbitals_to_dicts(
+                expanded.pop("orbital_energies"),
+                expanded.pop("orbital_occupations"),
+                expanded.pop("orbital_symmetries")
+            )
+        if "frequencies" in expanded:
+            expanded["vibrations"] = _vibrations_to_dicts(
+                expanded.pop("frequencies"),
+                expanded.pop("intensities"),
+                expanded.pop("reduced_masses"),
+                expanded.pop("force_constants"),
+                expanded.pop("displacements")
+            )
+        return expanded
+
+    @staticmethod
+    def serialize_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return a JSON-ready copy of a result for display or storage.
+        
+        Calculations only record a cheap "timestamp_epoch" float and, in compact mode,
+        NumPy arrays; ISO "timestamp" strings and the dict layout are produced here,
+        including for nested ground state data.
+        """
+        serialized = MockQuantumAdapter.as_dicts(result)
+        epoch = serialized.pop("timestamp_epoch", None)
+        if epoch is not None:
+            serialized["timestamp"] = _iso(epoch)
+        if "ground_state_data" in serialized:
+            serialized["ground_state_data"] = MockQuantumAdapter.serialize_result(serialized["ground_state_data"])
+        return serialized
 
     def estimate_resources(self, molecule_data: Dict[str, Any], basis_set: str, experiment_type: str, **kwargs) -> Dict[str, Any]:
         """Estimate resources required for an experiment."""
@@ -424,114 +744,73 @@ class MockQuantumAdapter:
         
         # Assign complexity factors based on molecule size, basis set, and experiment type
         num_atoms = len(molecule_data["atoms"])
-        num_electrons = sum(self._get_num_electrons(atom["symbol"]) for atom in molecule_data["atoms"])
-        
-        # Basis set complexity factor
-        basis_factors = {
-            "sto-3g": 1.0,
-            "3-21g": 2.0,
-            "6-31g": 3.0,
-            "cc-pvdz": 4.0,
-            "cc-pvtz": 8.0
-        }
-        basis_factor = basis_factors.get(basis_set, 1.0)
-        
-        # Experiment type complexity factor
-        experiment_factors = {
-            "ground_state": 1.0,
-            "excited_state": 2.5,
-            "geometry_optimization": 3.0,
-            "vibrational_analysis": 5.0,
-            "dipole_moment": 1.2
-        }
-        experiment_factor = experiment_factors.get(experiment_type, 1.0)
-        
-        # Calculate memory requirements (in MB)
-        memory_mb = num_electrons**2 * basis_factor * experiment_factor * 0.1
-        
-        # Calculate disk requirements (in MB)
-        disk_mb = memory_mb * 5
+        num_electrons = self._TOTAL_ELECTRONS.get(molecule_data["id"])
+        if num_electrons is None:
+            # Custom molecule, count electrons atom by atom
+            num_electrons = sum(self._get_num_electrons(atom["symbol"]) for atom in molecule_data["atoms"])
         
-        # Calculate CPU requirements (in core-hours)
-        cpu_hours = num_electrons**2 * basis_factor * experiment_factor * 0.01
-        
-        # Calculate estimated runtime (in seconds)
-        runtime_sec = cpu_hours * 3600 / 8  # Assuming 8 cores
+        memory_mb, disk_mb, cpu_hours, runtime_sec = self._estimate_core(
+            basis_set, experiment_type, num_electrons
+        )
         
         return {
-            "memory_mb": round(memory_mb, 2),
-            "disk_mb": round(disk_mb, 2),
-            "cpu_hours": round(cpu_hours, 2),
-            "estimated_runtime_sec": round(runtime_sec, 2),
+            "memory_mb": memory_mb,
+            "disk_mb": disk_mb,
+            "cpu_hours": cpu_hours,
+            "estimated_runtime_sec": runtime_sec,
             "estimated_runtime_human": self._format_time(runtime_sec),
-            "basis_set_complexity": basis_factor,
-            "experiment_complexity": experiment_factor,
+            "basis_set_complexity": _BASIS_COMPLEXITY.get(basis_set, 1.0),
+            "experiment_complexity": _EXPERIMENT_COMPLEXITY.get(experiment_type, 1.0),
             "molecule_size": {
                 "atoms": num_atoms,
                 "electrons": num_electrons
             }
         }
 
-    def _simulate_calculation_time(self, molecule_data: Dict[str, Any], basis_set: str, factor: float = 1.0):
-        """Simulate calculation time for more realistic response times."""
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _estimate_core(basis_set: str, experiment_type: str, num_electrons: int) -> Tuple[float, float, float, float]:
+        """Return rounded (memory MB, disk MB, CPU hours, runtime seconds) estimates."""
+        return _resource_core(
+            num_electrons, _BASIS_COMPLEXITY.get(basis_set, 1.0), _EXPERIMENT_COMPLEXITY.get(experiment_type, 1.0)
+        )
+
+    def _atom_coords(self, molecule_data: Dict[str, Any]) -> np.ndarray:
+        """Get the (num_atoms, 3) coordinate array of a molecule, parsed once per system."""
+        system_id = molecule_data["id"]
+        coords = self._coords_cache.get(system_id)
+        if coords is None:
+            coords = np.array([[atom["x"], atom["y"], atom["z"]] for atom in molecule_data["atoms"]])
+            self._coords_cache[system_id] = coords
+        return coords
+
+    def _calculation_delay(self, molecule_data: Dict[str, Any], basis_set: str, factor: float = 1.0) -> float:
+        """Get the simulated calculation time in seconds."""
         # Calculate a reasonable time based on molecule size and basis set
         num_atoms = len(molecule_data["atoms"])
         
         # Basis set complexity factor
-        basis_factors = {
-            "sto-3g": 0.1,
-            "3-21g": 0.2,
-            "6-31g": 0.3,
-            "cc-pvdz": 0.5,
-            "cc-pvtz": 1.0
-        }
-        basis_factor = basis_factors.get(basis_set, 0.1)
+        basis_factor = _BASIS_TIME_FACTORS.get(basis_set, 0.1)
         
-        # Simulate calculation time (scaled down for testing purposes)
-        # In a real system, this would take minutes to hours
-        sim_time = num_atoms * basis_factor * factor * 0.05
-        time.sleep(sim_time)
+        # Scaled down for testing purposes; in a real system, this would take minutes to hours
+        return num_atoms * basis_factor * factor * 0.05
+
+    def _simulate_calculation_time(self, molecule_data: Dict[str, Any], basis_set: str, factor: float = 1.0):
+        """Block for the simulated calculation time, if latency simulation is enabled."""
+        if self.simulate_latency:
+            time.sleep(self._calculation_delay(molecule_data, basis_set, factor))
 
     def _calculate_runtime(self, molecule_data: Dict[str, Any], basis_set: str, factor: float = 1.0) -> float:
         """Calculate a realistic runtime for the calculation."""
-        num_atoms = len(molecule_data["atoms"])
-        
-        # Basis set complexity factor
-        basis_factors = {
-            "sto-3g": 1.0,
-            "3-21g": 2.0,
-            "6-31g": 3.0,
-            "cc-pvdz": 5.0,
-            "cc-pvtz": 10.0
-        }
-        basis_factor = basis_factors.get(basis_set, 1.0)
-        
-        # Base time in seconds
-        base_time = num_atoms**2 * basis_factor * factor
-        
-        # Add some randomness
-        runtime = base_time * (0.8 + random.uniform(0, 0.4))
-        
-        return runtime
+        return _calc_runtime_core(
+            len(molecule_data["atoms"]), _BASIS_RUNTIME_FACTORS.get(basis_set, 1.0), factor, self._rng.uniform(0, 0.4)
+        )
 
     def _get_num_electrons(self, element: str) -> int:
         """Get the number of electrons for an element."""
-        element_electrons = {
-            "H": 1, "He": 2, "Li": 3, "Be": 4, "B": 5, "C": 6, "N": 7, "O": 8, "F": 9, "Ne": 10,
-            "Na": 11, "Mg": 12, "Al": 13, "Si": 14, "P": 15, "S": 16, "Cl": 17, "Ar": 18
-        }
-        return element_electrons.get(element, 6)  # Default to carbon if unknown
+        return _ELEMENT_Z.get(element, 6)  # Default to carbon if unknown
 
     def _format_time(self, seconds: float) -> str:
         """Format time in seconds to a human-readable string."""
-        if seconds < 60:
-            return f"{seconds:.1f} seconds"
-        elif seconds < 3600:
-            minutes = seconds / 60
-            return f"{minutes:.1f} minutes"
-        elif seconds < 86400:
-            hours = seconds / 3600
-            return f"{hours:.1f} hours"
-        else:
-            days = seconds / 86400
-            return f"{days:.1f} days" 
\ No newline at end of file
+        divisor, unit = _TIME_UNITS[bisect_right(_TIME_THRESHOLDS, seconds)]
+        return f"{seconds / divisor:.1f} {unit}" 
\ No newline at end of file
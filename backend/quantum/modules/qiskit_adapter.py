@@ -2,8 +2,13 @@
 Qiskit-Nature adapter for quantum computations.
 """
 import time
+import traceback
+
 import numpy as np
-from typing import Dict, Any, Tuple, Optional, List
+from collections import OrderedDict
+from functools import lru_cache, reduce
+from weakref import WeakValueDictionary
+from typing import Dict, Any, Iterable, Tuple, Optional, List
 import logging
 
 # Set up logging
@@ -11,22 +16,508 @@ logger = logging.getLogger(__name__)
 
 # Import qiskit modules (Qiskit 2.0 compatibility)
 try:
+    from qiskit import transpile
     from qiskit_aer import Aer
-    from qiskit.primitives import Estimator
+    from qiskit_aer.primitives import Estimator as AerEstimator
+    from qiskit.primitives import Estimator, EstimatorResult
+    from qiskit.circuit import Parameter, ParameterExpression
     from qiskit.circuit.library import TwoLocal
     from qiskit.algorithms.minimum_eigensolvers import VQE, NumPyMinimumEigensolver
     from qiskit.algorithms.optimizers import COBYLA, SPSA, L_BFGS_B
+    from scipy.sparse.linalg import eigsh
     
     # Import qiskit-nature modules
     from qiskit_nature.second_q.drivers import PySCFDriver
     from qiskit_nature.second_q.mappers import JordanWignerMapper, ParityMapper, BravyiKitaevMapper
     from qiskit_nature.second_q.formats.molecule_info import MoleculeInfo
-    from qiskit_nature.second_q.transformers import FreezeCoreTransformer
+    from qiskit_nature.second_q.transformers import ActiveSpaceTransformer, FreezeCoreTransformer
     from qiskit_nature.second_q.problems import ElectronicStructureProblem
 except ImportError as e:
     logger.error(f"Error importing qiskit modules: {str(e)}")
     raise
 
+# Optional tensor-network backend for the largest noiseless circuits
+try:
+    import quimb
+    import quimb.tensor as qtn
+    QUIMB_AVAILABLE = True
+except ImportError:
+    QUIMB_AVAILABLE = False
+
+try:
+    import cotengra as ctg
+except ImportError:
+    ctg = None
+
+from ...utils.jit import NUMBA_AVAILABLE
+from .statevector import GATE_CZ, GATE_RY, zero_state, apply_gate, expectation, run_circuit
+
+
+# Supported molecules: per-system symbol and (n_atoms, 3) coordinate arrays
+_MOLECULE_DATA = {
+    "H2": {
+        "symbols": np.array(["H", "H"]),
+        "coords": np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 0.735]]),
+        "multiplicity": 1,
+        "charge": 0,
+    },
+    "LiH": {
+        "symbols": np.array(["Li", "H"]),
+        "coords": np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 1.5]]),
+        "multiplicity": 1,
+        "charge": 0,
+    },
+    "H2O": {
+        "symbols": np.array(["O", "H", "H"]),
+        "coords": np.array([[0.0, 0.0, 0.0], [0.757, 0.586, 0.0], [-0.757, 0.586, 0.0]]),
+        "multiplicity": 1,
+        "charge": 0,
+    },
+    "H": {
+        "symbols": np.array(["H"]),
+        "coords": np.zeros((1, 3)),
+        "multiplicity": 2,
+        "charge": 0,
+    },
+    "He": {
+        "symbols": np.array(["He"]),
+        "coords": np.zeros((1, 3)),
+        "multiplicity": 1,
+        "charge": 0,
+    },
+    "Li": {
+        "symbols": np.array(["Li"]),
+        "coords": np.zeros((1, 3)),
+        "multiplicity": 2,
+        "charge": 0,
+    },
+}
+
+# MoleculeInfo objects, built on first use and kept while anything references them
+_MOLECULES: "WeakValueDictionary[str, MoleculeInfo]" = WeakValueDictionary()
+
+_MAPPER_CLASSES = {
+    "JW": JordanWignerMapper,
+    "Parity": ParityMapper,
+    "BK": BravyiKitaevMapper,
+}
+
+
+@lru_cache(maxsize=None)
+def _mapper(mapper_id: str):
+    """Build each qubit mapper once."""
+    if mapper_id not in _MAPPER_CLASSES:
+        raise ValueError(f"Unknown mapper: {mapper_id}")
+    return _MAPPER_CLASSES[mapper_id]()
+
+
+@lru_cache(maxsize=None)
+def _optimizer(optimizer_id: str, maxiter: Optional[int], max_evals_grouped: int = 1):
+    """
+    Build each optimizer once per (ID, iteration limit, evaluation batch size).
+    
+    A maxiter of None uses the optimizer's default limit. With max_evals_grouped > 1
+    the optimizer hands VQE several parameter vectors at a time, which VQE submits to
+    the estimator as one job.
+    """
+    if optimizer_id == "COBYLA":
+        optimizer = COBYLA(maxiter=1000 if maxiter is None else maxiter)
+    elif optimizer_id == "L_BFGS_B":
+        optimizer = L_BFGS_B(maxfun=1000 if maxiter is None else maxiter)
+    elif optimizer_id == "SPSA":
+        optimizer = SPSA(maxiter=100 if maxiter is None else maxiter)
+    else:
+        raise ValueError(f"Unknown optimizer: {optimizer_id}")
+    optimizer.set_max_evals_grouped(max_evals_grouped)
+    return optimizer
+
+
+def _evals_grouped(optimizer_id: str, num_parameters: int) -> int:
+    """Number of energy evaluations an optimizer can batch into one estimator call."""
+    if optimizer_id == "SPSA":
+        # The +/- perturbation pair of each step
+        return 2
+    if optimizer_id == "L_BFGS_B":
+        # The point plus one finite-difference shift per parameter
+        return num_parameters + 1
+    # COBYLA evaluates strictly one point at a time
+    return 1
+
+
+@lru_cache(maxsize=32)
+def _ansatz(num_qubits: int, ansatz_id: str, reps: int = 2, entanglement: str = "full"):
+    """
+    Build and transpile an ansatz once per shape.
+    
+    The cached circuit is only ever bound to new parameter values, never modified,
+    so every VQE run on the same shape reuses it. It is kept in the RY/CZ basis so the
+    compiled statevector kernels can run it (heavier optimization levels consolidate
+    gates into generic unitary blocks).
+    """
+    if ansatz_id != "TwoLocal":
+        raise ValueError(f"Unknown ansatz: {ansatz_id}")
+    ansatz = TwoLocal(num_qubits, "ry", "cz", reps=reps, entanglement=entanglement)
+    ansatz = transpile(ansatz, basis_gates=list(_KERNEL_GATES), optimization_level=1)
+    unsupported = set(ansatz.count_ops()) - set(_KERNEL_GATES) - {"barrier"}
+    if unsupported:
+        raise ValueError(f"Transpiled ansatz has gates without compiled kernels: {sorted(unsupported)}")
+    return ansatz
+
+
+# Active spaces as (electrons, spatial orbitals), applied after freezing the core
+_ACTIVE_SPACES = {
+    "LiH": (2, 3),
+    "H2O": (4, 4),
+}
+
+
+@lru_cache(maxsize=64)
+def _build_problem(system_id: str, basis_set: str):
+    """Build the electronic structure problem and its second-quantized Hamiltonian once per system and basis."""
+    # Get molecule
+    molecule = QiskitAdapter.get_molecule(system_id)
+    
+    # Create driver
+    driver = PySCFDriver(
+        molecule=molecule,
+        basis=basis_set
+    )
+    
+    # Create electronic structure problem
+    problem = ElectronicStructureProblem(driver)
+    
+    # Apply freeze core transformation if molecules are larger than H or H2
+    if system_id not in ["H", "H2"]:
+        problem.transformers = [FreezeCoreTransformer()]
+    
+    # Restrict larger molecules to an active space around the frontier orbitals
+    if system_id in _ACTIVE_SPACES:
+        num_electrons, num_spatial_orbitals = _ACTIVE_SPACES[system_id]
+        problem.transformers.append(ActiveSpaceTransformer(num_electrons, num_spatial_orbitals))
+    
+    # Create second quantized operators
+    return problem, problem.hamiltonian.second_q_op()
+
+
+@lru_cache(maxsize=64)
+def _map_hamiltonian(system_id: str, basis_set: str, mapper_id: str):
+    """
+    Map a system's Hamiltonian to a qubit operator once per system, basis and mapper.
+    
+    The mapper is tapered with the problem's Z2 symmetries, each of which removes
+    one qubit in the symmetry sector of the problem's reference state.
+    """
+    problem, hamiltonian = _build_problem(system_id, basis_set)
+    mapper = problem.get_tapered_mapper(QiskitAdapter.get_mapper(mapper_id))
+    return mapper.map(hamiltonian)
+
+
+# Above this many qubits the reference energy uses sparse Lanczos instead of dense diagonalization
+_DENSE_REFERENCE_MAX_QUBITS = 4
+
+
+def _reference_energy(qubit_op) -> float:
+    """Exact ground state energy of a qubit operator."""
+    if qubit_op.num_qubits <= _DENSE_REFERENCE_MAX_QUBITS:
+        return NumPyMinimumEigensolver().compute_minimum_eigenvalue(qubit_op).eigenvalue.real
+    # Only the lowest eigenvalue is needed, so avoid densifying the 2^n x 2^n matrix
+    if hasattr(qubit_op, "to_spmatrix"):
+        # PauliSumOp, which qiskit-nature mappers return while opflow output is enabled
+        sparse_matrix = qubit_op.to_spmatrix()
+    else:
+        sparse_matrix = qubit_op.to_matrix(sparse=True)
+    sparse_matrix = sparse_matrix.astype(np.complex128)
+    return float(eigsh(sparse_matrix, k=1, which="SA", return_eigenvectors=False)[0].real)
+
+
+# Largest noiseless circuit evaluated by the in-process statevector simulator
+_STATEVECTOR_MAX_QUBITS = 14
+
+
+# Gates with compiled statevector kernels
+_KERNEL_GATES = {"ry": GATE_RY, "cz": GATE_CZ}
+
+
+def _compile_circuit(circuit) -> Optional[Tuple[np.ndarray, ...]]:
+    """
+    Lower a parameterized circuit once to arrays for run_circuit.
+    
+    Returns (gate_types, gate_qubits, angles, gate_slots, parameter_slots): `angles`
+    holds the fixed angles, and on each evaluation gate_slots are filled from the
+    parameter values at parameter_slots (indices into circuit.parameters, the order
+    the Estimator passes values in). Returns None if the circuit uses a gate without
+    a compiled kernel or an angle that is an expression of several parameters.
+    """
+    parameter_indices = {parameter: index for index, parameter in enumerate(circuit.parameters)}
+    num_gates = len(circuit.data)
+    gate_types = np.empty(num_gates, dtype=np.int32)
+    gate_qubits = np.zeros((num_gates, 2), dtype=np.int32)
+    angles = np.zeros(num_gates, dtype=np.float64)
+    gate_slots = []
+    parameter_slots = []
+    count = 0
+    for instruction in circuit.data:
+        operation = instruction.operation
+        if operation.name == "barrier":
+            continue
+        gate_type = _KERNEL_GATES.get(operation.name)
+        if gate_type is None:
+            return None
+        gate_types[count] = gate_type
+        for slot, qubit in enumerate(instruction.qubits):
+            gate_qubits[count, slot] = circuit.find_bit(qubit).index
+        if operation.params:
+            angle = operation.params[0]
+            if isinstance(angle, Parameter):
+                gate_slots.append(count)
+                parameter_slots.append(parameter_indices[angle])
+            elif isinstance(angle, ParameterExpression) and angle.parameters:
+                return None
+            else:
+                angles[count] = float(angle)
+        count += 1
+    return (
+        gate_types[:count],
+        gate_qubits[:count],
+        angles[:count],
+        np.asarray(gate_slots, dtype=np.intp),
+        np.asarray(parameter_slots, dtype=np.intp),
+    )
+
+
+def _statevector_expectation(
+    circuit, parameter_values, observable_matrix, dtype=np.complex128, compiled=None
+) -> float:
+    """
+    Simulate a parameterized circuit and return its energy expectation.
+    
+    With a template from _compile_circuit, the parameter values are scattered into its
+    angle array and the native kernels run it; otherwise the circuit is bound and
+    applied gate by gate with NumPy.
+    """
+    if compiled is not None:
+        gate_types, gate_qubits, angles, gate_slots, parameter_slots = compiled
+        angles = angles.copy()
+        angles[gate_slots] = np.asarray(parameter_values, dtype=np.float64)[parameter_slots]
+        state = zero_state(circuit.num_qubits, dtype)
+        run_circuit(state, gate_types, gate_qubits, angles)
+        return expectation(state, observable_matrix)
+    
+    bound = circuit.assign_parameters(parameter_values) if circuit.num_parameters else circuit
+    state = zero_state(bound.num_qubits, dtype)
+    for instruction in bound.data:
+        operation = instruction.operation
+        if operation.name == "barrier":
+            continue
+        qubits = [bound.find_bit(qubit).index for qubit in instruction.qubits]
+        state = apply_gate(state, operation.to_matrix(), qubits)
+    return expectation(state, observable_matrix)
+
+
+# Observables kept prepared per estimator; estimators live as long as their process,
+# so older Hamiltonians are evicted rather than held forever
+_OBSERVABLE_CACHE_SIZE = 4
+
+
+def _prepared_observable(cache: "OrderedDict[int, Any]", observable_index: int, prepare):
+    """
+    Look up a prepared form of an estimator's observable in a small LRU cache.
+    
+    The Estimator stores each distinct observable once, so its index identifies the
+    observable object for the life of the estimator.
+    """
+    prepared = cache.get(observable_index)
+    if prepared is None:
+        prepared = prepare()
+        cache[observable_index] = prepared
+        if len(cache) > _OBSERVABLE_CACHE_SIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(observable_index)
+    return prepared
+
+
+class _StatevectorEstimator(Estimator):
+    """Reference Estimator whose expectation values come from the in-process statevector simulator."""
+
+    def __init__(self, dtype=np.complex128):
+        super().__init__()
+        self._dtype = dtype
+        # Sparse observable matrices, keyed by the observable's index in self._observables
+        self._observable_matrices: "OrderedDict[int, Any]" = OrderedDict()
+        # Kernel templates (or None), keyed by the circuit's index in self._circuits;
+        # a few small arrays per ansatz, and ansatzes are themselves a bounded cache
+        self._circuit_templates: Dict[int, Optional[Tuple[np.ndarray, ...]]] = {}
+
+    def _call(self, circuits, observables, parameter_values, **run_options) -> EstimatorResult:
+        values = []
+        for circuit_index, observable_index, params in zip(circuits, observables, parameter_values):
+            matrix = _prepared_observable(
+                self._observable_matrices,
+                observable_index,
+                lambda: self._observables[observable_index].to_matrix(sparse=True).astype(self._dtype)
+            )
+            circuit = self._circuits[circuit_index]
+            if circuit_index not in self._circuit_templates:
+                # Native kernels when numba can compile them, otherwise the NumPy gate-matrix path
+                self._circuit_templates[circuit_index] = _compile_circuit(circuit) if NUMBA_AVAILABLE else None
+            values.append(_statevector_expectation(
+                circuit, params, matrix, self._dtype, self._circuit_templates[circuit_index]
+            ))
+        return EstimatorResult(np.asarray(values, dtype=np.float64), [{} for _ in values])
+
+
+@lru_cache(maxsize=None)
+def _contraction_optimizer(num_qubits: int):
+    """
+    Contraction path finder for one circuit width, kept for the life of the process.
+    
+    cotengra's ReusableHyperOptimizer stores the tree it finds for each contraction, so
+    evaluations at new parameter values skip the search. Without cotengra, quimb's own
+    'auto-hq' path finder is used.
+    """
+    if ctg is None:
+        return "auto-hq"
+    return ctg.ReusableHyperOptimizer(max_repeats=32, parallel=False)
+
+
+def _pauli_terms(observable) -> Tuple[float, List[Tuple[Tuple[int, ...], np.ndarray]]]:
+    """
+    Group a SparsePauliOp by the qubits its terms act on.
+    
+    Returns the identity terms' constant and one (qubits, local operator) pair per
+    distinct support, with the coefficient-weighted terms on that support summed, so
+    each support is contracted once per evaluation.
+    """
+    constant = 0.0
+    grouped: Dict[Tuple[int, ...], np.ndarray] = {}
+    for label, coeff in observable.to_list():
+        num_qubits = len(label)
+        # Pauli labels are little-endian: the last character acts on qubit 0
+        where = tuple(q for q in range(num_qubits) if label[num_qubits - 1 - q] != "I")
+        if not where:
+            constant += float(np.real(coeff))
+            continue
+        operator = coeff * reduce(np.kron, (quimb.pauli(label[num_qubits - 1 - q]) for q in where))
+        grouped[where] = grouped[where] + operator if where in grouped else operator
+    return constant, list(grouped.items())
+
+
+def _quimb_expectation(circuit, parameter_values, pauli_terms, optimize, compiled=None) -> float:
+    """
+    Build the circuit as a quimb tensor network once, then contract every grouped
+    Pauli term against it.
+    
+    With a template from _compile_circuit the gates are applied straight from its
+    arrays; otherwise the circuit is bound and its gate matrices applied.
+    """
+    if compiled is not None:
+        gate_types, gate_qubits, angles, gate_slots, parameter_slots = compiled
+        angles = angles.copy()
+        angles[gate_slots] = np.asarray(parameter_values, dtype=np.float64)[parameter_slots]
+        tn_circuit = qtn.Circuit(circuit.num_qubits)
+        for gate_type, qubits, angle in zip(gate_types.tolist(), gate_qubits.tolist(), angles.tolist()):
+            if gate_type == GATE_RY:
+                tn_circuit.apply_gate("RY", angle, qubits[0])
+            else:
+                tn_circuit.apply_gate("CZ", *qubits)
+    else:
+        bound = circuit.assign_parameters(parameter_values) if circuit.num_parameters else circuit
+        tn_circuit = qtn.Circuit(bound.num_qubits)
+        for instruction in bound.data:
+            operation = instruction.operation
+            if operation.name == "barrier":
+                continue
+            qubits = [bound.find_bit(qubit).index for qubit in instruction.qubits]
+            # Qiskit gate matrices put qubits[0] in the least significant bit, quimb in the most
+            tn_circuit.apply_gate(operation.to_matrix(), *reversed(qubits))
+    
+    constant, terms = pauli_terms
+    energy = constant
+    for where, operator in terms:
+        value = tn_circuit.local_expectation(
+            operator, where, optimize=optimize, simplify_sequence="ADCRS"
+        )
+        energy += float(np.real(value))
+    return energy
+
+
+class _TensorNetworkEstimator(Estimator):
+    """Reference Estimator whose expectation values come from quimb tensor-network contractions."""
+
+    def __init__(self, optimize):
+        super().__init__()
+        self._optimize = optimize
+        # Grouped Pauli terms, keyed by the observable's index in self._observables
+        self._observable_terms: "OrderedDict[int, Any]" = OrderedDict()
+        # Gate templates (or None), keyed by the circuit's index in self._circuits
+        self._circuit_templates: Dict[int, Optional[Tuple[np.ndarray, ...]]] = {}
+
+    def _call(self, circuits, observables, parameter_values, **run_options) -> EstimatorResult:
+        values = []
+        for circuit_index, observable_index, params in zip(circuits, observables, parameter_values):
+            terms = _prepared_observable(
+                self._observable_terms,
+                observable_index,
+                lambda: _pauli_terms(self._observables[observable_index])
+            )
+            circuit = self._circuits[circuit_index]
+            if circuit_index not in self._circuit_templates:
+                self._circuit_templates[circuit_index] = _compile_circuit(circuit)
+            values.append(_quimb_expectation(
+                circuit, params, terms, self._optimize, self._circuit_templates[circuit_index]
+            ))
+        return EstimatorResult(np.asarray(values, dtype=np.float64), [{} for _ in values])
+
+
+# Statevector dtype for each configuration precision
+_PRECISION_DTYPES = {"single": np.complex64, "double": np.complex128}
+
+
+@lru_cache(maxsize=32)
+def _estimator(num_qubits: int, shots: Optional[int] = None, precision: str = "double"):
+    """
+    Get the estimator for a run, built once per process for each choice.
+    
+    Reused estimators keep the circuits and observables they have already seen, which
+    are themselves cached, so repeat runs skip primitive and simulator set-up.
+    
+    Noiseless runs up to _STATEVECTOR_MAX_QUBITS use the in-process statevector
+    simulator, at the requested precision, which is exact and fastest at those sizes.
+    Wider ones are contracted as tensor networks when quimb is installed, and
+    otherwise use the exact reference Estimator.
+    
+    Shot-based runs use Aer with abelian grouping, so the Hamiltonian is split into
+    qubit-wise commuting groups once and each group is measured with a single circuit
+    on every evaluation.
+    """
+    if shots is None:
+        if num_qubits <= _STATEVECTOR_MAX_QUBITS:
+            return _StatevectorEstimator(_PRECISION_DTYPES[precision])
+        if QUIMB_AVAILABLE:
+            return _TensorNetworkEstimator(_contraction_optimizer(num_qubits))
+        return Estimator()
+    return AerEstimator(
+        run_options={"shots": shots},
+        backend_options={"max_parallel_threads": 1},
+        abelian_grouping=True,
+        approximation=False
+    )
+
+
+def _run_vqe(
+    qubit_op,
+    ansatz,
+    optimizer,
+    shots: Optional[int] = None,
+    precision: str = "double",
+    initial_point: Optional[np.ndarray] = None
+):
+    """Run one VQE optimization from an optional initial point."""
+    estimator = _estimator(qubit_op.num_qubits, shots, precision)
+    vqe = VQE(estimator, ansatz, optimizer, initial_point=initial_point)
+    return vqe.compute_minimum_eigenvalue(qubit_op)
+
 
 class QiskitAdapter:
     """Adapter for Qiskit-Nature quantum chemistry calculations."""
@@ -34,83 +525,44 @@ class QiskitAdapter:
     @staticmethod
     def get_molecule(system_id: str) -> MoleculeInfo:
         """Get a molecule object based on system ID."""
-        molecules = {
-            "H2": MoleculeInfo(
-                symbols=["H", "H"],
-                coords=[(0.0, 0.0, 0.0), (0.0, 0.0, 0.735)],
-                multiplicity=1,
-                charge=0
-            ),
-            "LiH": MoleculeInfo(
-                symbols=["Li", "H"],
-                coords=[(0.0, 0.0, 0.0), (0.0, 0.0, 1.5)],
-                multiplicity=1,
-                charge=0
-            ),
-            "H2O": MoleculeInfo(
-                symbols=["O", "H", "H"],
-                coords=[(0.0, 0.0, 0.0), (0.757, 0.586, 0.0), (-0.757, 0.586, 0.0)],
-                multiplicity=1,
-                charge=0
-            ),
-            "H": MoleculeInfo(
-                symbols=["H"],
-                coords=[(0.0, 0.0, 0.0)],
-                multiplicity=2,
-                charge=0
-            ),
-            "He": MoleculeInfo(
-                symbols=["He"],
-                coords=[(0.0, 0.0, 0.0)],
-                multiplicity=1,
-                charge=0
-            ),
-            "Li": MoleculeInfo(
-                symbols=["Li"],
-                coords=[(0.0, 0.0, 0.0)],
-                multiplicity=2,
-                charge=0
-            ),
-        }
-        
-        if system_id not in molecules:
-            raise ValueError(f"Unknown system: {system_id}")
+        molecule = _MOLECULES.get(system_id)
+        if molecule is None:
+            if system_id not in _MOLECULE_DATA:
+                raise ValueError(f"Unknown system: {system_id}")
             
-        return molecules[system_id]
+            data = _MOLECULE_DATA[system_id]
+            molecule = MoleculeInfo(
+                symbols=data["symbols"].tolist(),
+                coords=data["coords"],
+                multiplicity=data["multiplicity"],
+                charge=data["charge"]
+            )
+            _MOLECULES[system_id] = molecule
+        return molecule
+
+    @staticmethod
+    def warm_up(qubit_counts: Iterable[int]) -> None:
+        """Build the default ansatz and noiseless estimator for each qubit count."""
+        for num_qubits in qubit_counts:
+            _ansatz(num_qubits, "TwoLocal", reps=2, entanglement="full")
+            _estimator(num_qubits)
 
     @staticmethod
     def get_mapper(mapper_id: str):
         """Get a qubit mapping based on mapper ID."""
-        mappers = {
-            "JW": JordanWignerMapper(),
-            "Parity": ParityMapper(),
-            "BK": BravyiKitaevMapper(),
-        }
-        
-        if mapper_id not in mappers:
-            raise ValueError(f"Unknown mapper: {mapper_id}")
-            
-        return mappers[mapper_id]
+        return _mapper(mapper_id)
 
     @staticmethod
     def get_optimizer(optimizer_id: str, **kwargs):
         """Get optimizer based on optimizer ID."""
-        optimizers = {
-            "COBYLA": COBYLA(maxiter=kwargs.get("maxiter", 1000)),
-            "L_BFGS_B": L_BFGS_B(maxfun=kwargs.get("maxiter", 1000)),
-            "SPSA": SPSA(maxiter=kwargs.get("maxiter", 100)),
-        }
-        
-        if optimizer_id not in optimizers:
-            raise ValueError(f"Unknown optimizer: {optimizer_id}")
-            
-        return optimizers[optimizer_id]
+        return _optimizer(optimizer_id, kwargs.get("maxiter"), kwargs.get("max_evals_grouped", 1))
 
     @staticmethod
     def calculate_ground_state(
         system_id: str,
         basis_set: str,
-        configuration: Dict[str, Any]
+        configuration: Dict[str, Any],
+        num_restarts: int = 1
     ) -> Dict[str, Any]:
         """
         Calculate the ground state energy using Qiskit-Nature.
@@ -119,6 +571,8 @@ class QiskitAdapter:
             system_id: ID of the quantum system
             basis_set: Basis set to use
             configuration: Experiment configuration
+            num_restarts: VQE runs from random initial points, run one after another
+                in the calling worker process; the lowest-energy result is kept
             
         Returns:
             Dictionary with calculation results
@@ -126,65 +580,68 @@ class QiskitAdapter:
         start_time = time.time()
         
         try:
-            # Get molecule
-            molecule = QiskitAdapter.get_molecule(system_id)
-            
-            # Create driver
-            driver = PySCFDriver(
-                molecule=molecule,
-                basis=basis_set
-            )
-            
-            # Create electronic structure problem
-            problem = ElectronicStructureProblem(driver)
-            
-            # Apply freeze core transformation if molecules are larger than H or H2
-            if system_id not in ["H", "H2"]:
-                problem.transformers = [FreezeCoreTransformer()]
-            
-            # Get mapper
-            mapper = QiskitAdapter.get_mapper(configuration["mapper"])
-            
-            # Create second quantized operators
-            hamiltonian = problem.hamiltonian.second_q_op()
-            
-            # Convert to qubit operator
-            qubit_op = mapper.map(hamiltonian)
+            # Build (or reuse) the qubit Hamiltonian for this system, basis and mapper
+            qubit_op = _map_hamiltonian(system_id, basis_set, configuration["mapper"])
             num_qubits = qubit_op.num_qubits
             
-            # Get the reference (exact) energy using NumPy
-            numpy_solver = NumPyMinimumEigensolver()
-            reference_calc = numpy_solver.compute_minimum_eigenvalue(qubit_op)
-            reference_energy = reference_calc.eigenvalue.real
+            # Get the reference (exact) energy
+            reference_energy = _reference_energy(qubit_op)
             
             # For VQE calculations
             if configuration["algorithm"] == "VQE":
-                # Set up the ansatz circuit
-                if configuration["ansatz"] == "TwoLocal":
-                    ansatz = TwoLocal(num_qubits, "ry", "cz", reps=2, entanglement="full")
-                else:
-                    # Default to TwoLocal for now
-                    ansatz = TwoLocal(num_qubits, "ry", "cz", reps=2, entanglement="full")
+                # Set up the ansatz circuit (other ansatzes default to TwoLocal for now)
+                ansatz = _ansatz(num_qubits, "TwoLocal", reps=2, entanglement="full")
                 
-                # Create the optimizer
-                optimizer = QiskitAdapter.get_optimizer("COBYLA", maxiter=100)
+                # Create the configured optimizer; SPSA's perturbation pair goes out as one batch
+                optimizer_id = configuration.get("optimizer", "COBYLA")
+                optimizer = QiskitAdapter.get_optimizer(
+                    optimizer_id,
+                    maxiter=100,
+                    max_evals_grouped=_evals_grouped(optimizer_id, ansatz.num_parameters)
+                )
                 
-                # Create the VQE instance
-                estimator = Estimator()
-                vqe = VQE(estimator, ansatz, optimizer)
+                # Noiseless unless a shot count is requested
+                shots = (configuration.get("advanced_options") or {}).get("shots")
+                precision = configuration.get("precision", "double")
                 
-                # Run VQE
-                vqe_result = vqe.compute_minimum_eigenvalue(qubit_op)
+                # Run VQE; restarts run sequentially so a run stays within its worker's
+                # share of the bounded job pool and reuses its warmed estimator
+                if num_restarts > 1:
+                    initial_points = np.random.default_rng().uniform(
+                        -np.pi, np.pi, (num_restarts, ansatz.num_parameters)
+                    )
+                    vqe_result = min(
+                        (
+                            _run_vqe(qubit_op, ansatz, optimizer, shots, precision, initial_point)
+                            for initial_point in initial_points
+                        ),
+                        key=lambda restart: restart.eigenvalue.real
+                    )
+                else:
+                    vqe_result = _run_vqe(qubit_op, ansatz, optimizer, shots, precision)
                 
                 # Extract results
                 energy = vqe_result.eigenvalue.real
                 iterations = len(vqe_result.optimizer_evals) if hasattr(vqe_result, 'optimizer_evals') else 1
                 convergence = abs(energy - reference_energy)
                 
+                # Convert optimizer output with one vectorized cast each
+                optimizer_history = (
+                    np.asarray(vqe_result.optimizer_evals, dtype=np.float64).tolist()
+                    if hasattr(vqe_result, 'optimizer_evals') else []
+                )
+                optimal_parameters = {}
+                if hasattr(vqe_result, 'optimal_parameters'):
+                    parameters = list(vqe_result.optimal_parameters)
+                    values = np.fromiter(
+                        vqe_result.optimal_parameters.values(), dtype=np.float64, count=len(parameters)
+                    )
+                    optimal_parameters = dict(zip(parameters, values.tolist()))
+                
                 # Create result data
                 data = {
-                    "optimizer_history": [float(x) for x in vqe_result.optimizer_evals] if hasattr(vqe_result, 'optimizer_evals') else [],
-                    "optimal_parameters": {k: float(v) for k, v in vqe_result.optimal_parameters.items()} if hasattr(vqe_result, 'optimal_parameters') else {},
+                    "optimizer_history": optimizer_history,
+                    "optimal_parameters": optimal_parameters,
                     "optimal_circuit": ansatz.draw(output="text"),
                 }
             else:
@@ -207,11 +664,15 @@ class QiskitAdapter:
                 "data": data
             }
         except Exception as e:
-            # Log the error and return an error result
-            import traceback
-            error_details = traceback.format_exc()
-            return {
+            # Log the error, with its traceback only when debugging, and return an error result
+            debug = logger.isEnabledFor(logging.DEBUG)
+            logger.error(
+                "Error in quantum calculation for %s/%s: %s", system_id, basis_set, e, exc_info=debug
+            )
+            error_result = {
                 "error": f"Error in quantum calculation: {str(e)}",
-                "error_details": error_details,
                 "runtime": time.time() - start_time
-            } 
\ No newline at end of file
+            }
+            if debug:
+                error_result["error_details"] = traceback.format_exc()
+            return error_result 
\ No newline at end of file
@@ -0,0 +1,95 @@
+"""
+Dense statevector simulation for small ansatz circuits.
+
+States are flat arrays of 2**n amplitudes in Qiskit's little-endian qubit order
+(qubit 0 is the least significant bit of the basis-state index).
+"""
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from ...utils.jit import njit
+
+# Gate codes for circuits compiled to (gate_types, gate_qubits, gate_params) arrays
+GATE_RY = 0
+GATE_CZ = 1
+
+
+def zero_state(num_qubits: int, dtype=np.complex128) -> np.ndarray:
+    """Return the |0...0> state; complex64 halves memory traffic at single precision."""
+    state = np.zeros(2 ** num_qubits, dtype=dtype)
+    state[0] = 1.0
+    return state
+
+
+@lru_cache(maxsize=None)
+def _gate_axes(num_qubits: int, qubits: Tuple[int, ...]) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """
+    Tensor axes of a gate's target qubits and the leading axes they are moved to.
+
+    Fixed per (num_qubits, qubits), so each gate layout is worked out once per process.
+    """
+    # Tensor axis of qubit q is num_qubits - 1 - q; the matrix's most significant bit comes first
+    axes = tuple(num_qubits - 1 - q for q in reversed(qubits))
+    return axes, tuple(range(len(qubits)))
+
+
+def apply_gate(state: np.ndarray, matrix: np.ndarray, qubits: Sequence[int]) -> np.ndarray:
+    """
+    Apply a gate matrix to the given qubits of a state.
+
+    The matrix follows Qiskit's convention, with qubits[0] as its least significant bit.
+    The target axes are moved to the front, the state is unfolded to a
+    (2**k, rest) matrix and multiplied, then folded back.
+    """
+    num_qubits = state.size.bit_length() - 1
+    axes, front = _gate_axes(num_qubits, tuple(qubits))
+
+    tensor = np.moveaxis(state.reshape((2,) * num_qubits), axes, front)
+    unfolded = matrix.astype(state.dtype, copy=False) @ tensor.reshape(2 ** len(front), -1)
+    tensor = np.moveaxis(unfolded.reshape((2,) * num_qubits), front, axes)
+    return tensor.reshape(-1)
+
+
+def expectation(state: np.ndarray, observable_matrix) -> float:
+    """Return the real expectation value <state|observable|state> for a dense or sparse matrix."""
+    return float(np.vdot(state, observable_matrix @ state).real)
+
+
+# Gates are memory-bound at these sizes (at most 2**14 amplitudes), so the kernels
+# stay serial and don't start a thread pool in every worker process
+@njit(cache=True, fastmath=True)
+def apply_ry(state, qubit, theta):
+    """Apply RY(theta) to one qubit of a flat complex state in place."""
+    c = np.cos(theta / 2)
+    s = np.sin(theta / 2)
+    stride = 1 << qubit
+    low_mask = stride - 1
+    for k in range(state.size // 2):
+        # k with a zero bit inserted at `qubit` gives the |0> index of the amplitude pair
+        i0 = ((k >> qubit) << (qubit + 1)) | (k & low_mask)
+        i1 = i0 | stride
+        a0 = state[i0]
+        a1 = state[i1]
+        state[i0] = c * a0 - s * a1
+        state[i1] = s * a0 + c * a1
+
+
+@njit(cache=True, fastmath=True)
+def apply_cz(state, q0, q1):
+    """Apply CZ between two qubits of a flat complex state in place."""
+    mask = (1 << q0) | (1 << q1)
+    for i in range(state.size):
+        if i & mask == mask:
+            state[i] = -state[i]
+
+
+@njit(cache=True)
+def run_circuit(state, gate_types, gate_qubits, gate_params):
+    """Apply a compiled circuit to a state in place, gate by gate."""
+    for g in range(gate_types.size):
+        if gate_types[g] == GATE_RY:
+            apply_ry(state, gate_qubits[g, 0], gate_params[g])
+        elif gate_types[g] == GATE_CZ:
+            apply_cz(state, gate_qubits[g, 0], gate_qubits[g, 1])
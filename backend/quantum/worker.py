@@ -0,0 +1,126 @@
+"""
+Process pool for running quantum experiments off the API process.
+
+Each worker process loads the quantum adapter once and warms it up (transpiled
+ansatz circuits and estimators for common qubit counts), so individual runs skip
+that fixed start-up cost. Runs also no longer hold the API process's GIL.
+
+This module must not import numpy (directly or through the quantum manager) at
+import time: workers import it before their initializer pins BLAS threading.
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Dict, Any, Optional
+
+from ..config import QUANTUM_MAX_JOBS
+
+logger = logging.getLogger(__name__)
+
+# Ansatz widths prepared in every worker at start-up
+_WARM_QUBIT_COUNTS = (2, 4, 6, 8, 10, 12)
+
+# Keep BLAS single-threaded in workers: nested BLAS threads inside each energy
+# evaluation contend for locks, so parallelism is applied across runs instead
+_BLAS_THREAD_VARS = ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS")
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _init_worker(qubit_counts) -> None:
+    """Worker initializer: pin BLAS threading before numpy loads, then warm up the adapter."""
+    for var in _BLAS_THREAD_VARS:
+        os.environ.setdefault(var, "1")
+    
+    from .manager import QuantumModuleManager
+    QuantumModuleManager.warm_up(qubit_counts)
+
+
+def _run_experiment(**kwargs) -> Dict[str, Any]:
+    """Run an experiment inside a worker; the manager is imported lazily, see the module docstring."""
+    from .manager import QuantumModuleManager
+    return QuantumModuleManager.run_experiment(**kwargs)
+
+
+def _ping() -> None:
+    """No-op task used to start workers and wait for their warm-up."""
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Create the worker pool on first use."""
+    global _pool
+    if _pool is None:
+        # Spawned rather than forked, so workers don't inherit the server's threads and event loop
+        _pool = ProcessPoolExecutor(
+            max_workers=QUANTUM_MAX_JOBS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(_WARM_QUBIT_COUNTS,)
+        )
+    return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next run starts a fresh one; a no-op if it was already replaced."""
+    global _pool
+    if _pool is pool:
+        pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+async def start() -> None:
+    """
+    Start the workers and wait for them without blocking the event loop, so warm-up
+    happens (and fails loudly) at server start-up rather than on the first run.
+    """
+    pool = _get_pool()
+    # Re-raises warm-up errors, which break the pool
+    await asyncio.gather(
+        *(asyncio.wrap_future(pool.submit(_ping)) for _ in range(QUANTUM_MAX_JOBS))
+    )
+    logger.info(f"Started quantum worker pool with up to {QUANTUM_MAX_JOBS} processes")
+
+
+def shutdown() -> None:
+    """Stop the worker processes."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(cancel_futures=True)
+        _pool = None
+
+
+async def run_experiment(
+    system_id: str,
+    basis_set: str,
+    experiment_type: str,
+    configuration: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Run QuantumModuleManager.run_experiment in a worker process without blocking the event loop.
+    
+    If a worker has died (for example killed for memory), the pool is unusable: it is
+    discarded so the next run starts a fresh one, and this run fails. The run is not
+    retried, since it may be the one that brought the worker down.
+    """
+    loop = asyncio.get_running_loop()
+    call = partial(
+        _run_experiment,
+        system_id=system_id,
+        basis_set=basis_set,
+        experiment_type=experiment_type,
+        configuration=configuration
+    )
+    pool = _get_pool()
+    try:
+        return await loop.run_in_executor(pool, call)
+    except BrokenProcessPool:
+        logger.error(
+            f"Quantum worker died while running {experiment_type} on {system_id}/{basis_set}, "
+            "restarting the worker pool"
+        )
+        _discard_pool(pool)
+        raise
@@ -1,9 +1,9 @@
 """
 Schemas related to experiments.
 """
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Literal, Optional, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ExperimentConfig(BaseModel):
@@ -12,6 +12,12 @@ class ExperimentConfig(BaseModel):
     mapper: str
     hamiltonian: str
     algorithm: str
+    # Classical optimizer for VQE runs
+    optimizer: Literal["COBYLA", "SPSA", "L_BFGS_B"] = "COBYLA"
+    # Statevector simulation precision: complex64 ("single") or complex128 ("double")
+    precision: Literal["single", "double"] = "double"
+    # VQE runs from random initial points, executed in turn; the lowest energy is kept
+    num_restarts: int = Field(1, ge=1, le=16)
     advanced_options: Optional[Dict[str, Any]] = None
 
 
@@ -34,9 +40,19 @@ class ExperimentDB(ExperimentBase):
     id: int
     created_at: datetime
     
-    class Config:
-        """Pydantic config."""
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ExperimentSummary(BaseModel):
+    """Schema for experiment list views, without the configuration payload."""
+    id: int
+    name: Optional[str] = None
+    system_id: str
+    basis_set: str
+    experiment_type: str
+    created_at: datetime
+    
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ResourceEstimate(BaseModel):
@@ -3,7 +3,7 @@ Schemas related to experiment results.
 """
 from typing import Dict, List, Optional, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ExperimentResultBase(BaseModel):
@@ -27,9 +27,21 @@ class ExperimentResultDB(ExperimentResultBase):
     experiment_id: int
     created_at: datetime
     
-    class Config:
-        """Pydantic config."""
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ExperimentResultSummary(BaseModel):
+    """Schema for result list views, without the data payload."""
+    id: int
+    experiment_id: int
+    energy: float
+    reference_energy: Optional[float] = None
+    iterations: int
+    runtime: float
+    convergence: Optional[float] = None
+    created_at: datetime
+    
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ExperimentResultDetails(BaseModel):
@@ -45,6 +57,4 @@ class ExperimentResultDetails(BaseModel):
     system_name: str
     configuration: Dict[str, Any]
     
-    class Config:
-        """Pydantic config."""
-        orm_mode = True 
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True) 
\ No newline at end of file
@@ -0,0 +1,108 @@
+"""
+Endpoints must not lazily load relationships, one query per row.
+
+Endpoint requests run every ORM query with raiseload("*"), so an implicit
+relationship load fails instead of silently issuing extra SELECTs.
+ExperimentResult.experiment is lazy="raise" on its own and must be eager-loaded.
+"""
+import os
+import tempfile
+
+# Point the app at a throwaway database before any backend module reads the config
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/test.db"
+
+import httpx
+import pytest
+from sqlalchemy import event, insert, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session, raiseload
+
+from backend.db.database import SessionLocal, engine, init_models
+from backend.db.models import Experiment, ExperimentResult
+from backend.main import app
+
+NUM_EXPERIMENTS = 5
+RESULTS_PER_EXPERIMENT = 3
+
+
+def _raise_on_lazy_loads(orm_execute_state):
+    """Apply raiseload("*") to every ORM SELECT."""
+    if orm_execute_state.is_select:
+        orm_execute_state.statement = orm_execute_state.statement.options(raiseload("*"))
+
+
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    _count_statement.count += 1
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def seeded():
+    await init_models()
+    async with SessionLocal() as db:
+        for i in range(NUM_EXPERIMENTS):
+            experiment_id = await db.scalar(
+                insert(Experiment).values(
+                    name=f"Experiment {i}",
+                    system_id="h2o",
+                    basis_set="sto-3g",
+                    experiment_type="ground",
+                    configuration={"ansatz": "UCCSD", "mapper": "JW", "hamiltonian": "x", "algorithm": "VQE"}
+                ).returning(Experiment.id)
+            )
+            await db.execute(
+                insert(ExperimentResult),
+                [
+                    {"experiment_id": experiment_id, "energy": -75.0, "iterations": 10, "runtime": 1.0, "data": {}}
+                    for _ in range(RESULTS_PER_EXPERIMENT)
+                ]
+            )
+        await db.commit()
+
+
+@pytest.fixture
+async def client(seeded):
+    event.listen(Session, "do_orm_execute", _raise_on_lazy_loads)
+    event.listen(engine.sync_engine, "before_cursor_execute", _count_statement)
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            yield client
+    finally:
+        event.remove(Session, "do_orm_execute", _raise_on_lazy_loads)
+        event.remove(engine.sync_engine, "before_cursor_execute", _count_statement)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("path", ["/api/v1/experiments", "/api/v1/results"])
+async def test_list_endpoint_issues_one_query(client, path):
+    _count_statement.count = 0
+    response = await client.get(path)
+
+    assert response.status_code == 200
+    assert len(response.json()) >= NUM_EXPERIMENTS
+    assert _count_statement.count == 1
+
+
+@pytest.mark.anyio
+async def test_result_experiment_is_never_loaded_implicitly(seeded):
+    async with SessionLocal() as db:
+        result = (await db.execute(select(ExperimentResult).limit(1))).scalar_one()
+        with pytest.raises(InvalidRequestError):
+            result.experiment
+
+
+@pytest.mark.anyio
+async def test_result_details_load_experiment_in_one_query(client):
+    result_id = (await client.get("/api/v1/results")).json()[0]["id"]
+
+    _count_statement.count = 0
+    response = await client.get(f"/api/v1/results/{result_id}/details")
+
+    assert response.status_code == 200
+    assert response.json()["id"] == result_id
+    assert response.json()["system_name"] == "Water"
+    assert _count_statement.count == 1
@@ -0,0 +1,81 @@
+"""
+Response cache for read-heavy API endpoints.
+
+Uses Redis when REDIS_URL is configured, otherwise an in-process TTL cache.
+Cached values must be serializable by orjson.
+
+The in-process fallback is only safe with a single server worker: invalidations
+do not reach other workers' copies, which then serve stale entries for up to
+CACHE_TTL seconds. Set REDIS_URL when running more than one worker.
+"""
+import logging
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+
+from ..config import REDIS_URL, CACHE_TTL
+
+logger = logging.getLogger(__name__)
+
+_redis = None
+if REDIS_URL:
+    try:
+        import redis.asyncio as aioredis
+        _redis = aioredis.from_url(REDIS_URL)
+        logger.info("Using Redis response cache")
+    except ImportError:
+        logger.warning("REDIS_URL is set but redis is not installed, using in-process cache")
+
+# Fallback store: key -> (expiry timestamp, value), bounded in insertion order
+_MAX_MEMORY_ENTRIES = 1024
+_memory: Dict[str, Tuple[float, Any]] = {}
+
+
+async def cache_get(key: str) -> Optional[Any]:
+    """Get a cached value, or None on a miss."""
+    if _redis is not None:
+        raw = await _redis.get(key)
+        return orjson.loads(raw) if raw is not None else None
+
+    entry = _memory.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if expires_at < time.monotonic():
+        _memory.pop(key, None)
+        return None
+    return value
+
+
+async def cache_set(key: str, value: Any, expire: int = CACHE_TTL) -> None:
+    """Store a value for `expire` seconds."""
+    if _redis is not None:
+        await _redis.set(key, orjson.dumps(value), ex=expire)
+        return
+    if len(_memory) >= _MAX_MEMORY_ENTRIES:
+        _memory.pop(next(iter(_memory)))
+    _memory[key] = (time.monotonic() + expire, value)
+
+
+async def cache_add(key: str, value: Any, expire: int = CACHE_TTL) -> bool:
+    """Store a value only if the key is absent; returns whether it was stored."""
+    if _redis is not None:
+        return bool(await _redis.set(key, orjson.dumps(value), ex=expire, nx=True))
+    # No await between the check and the set, so this is atomic on the event loop
+    entry = _memory.get(key)
+    if entry is not None and entry[0] >= time.monotonic():
+        return False
+    if len(_memory) >= _MAX_MEMORY_ENTRIES:
+        _memory.pop(next(iter(_memory)))
+    _memory[key] = (time.monotonic() + expire, value)
+    return True
+
+
+async def cache_delete(*keys: str) -> None:
+    """Invalidate one or more keys."""
+    if _redis is not None:
+        await _redis.delete(*keys)
+        return
+    for key in keys:
+        _memory.pop(key, None)
@@ -1,31 +1,38 @@
 """
 Helper utility functions.
 """
-import json
-from datetime import datetime
 from typing import Dict, Any, List, Optional
 
-
-def json_serializer(obj):
-    """
-    Custom JSON serializer to handle non-JSON serializable objects.
-    """
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    raise TypeError(f"Type {type(obj)} not serializable")
+import numpy as np
+import orjson
+from sqlalchemy import inspect
 
 
 def serialize_to_json(data: Any) -> str:
     """
-    Serialize any data to JSON with custom handling of special types.
+    Serialize any data to JSON, including datetimes and NumPy arrays.
+    Naive datetimes (the models store datetime.utcnow()) are written as UTC.
     """
-    return json.dumps(data, default=json_serializer)
+    return orjson.dumps(
+        data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+    ).decode()
 
 
 def format_complex_to_float(val):
     """
     Format complex numbers to floats by taking the real part.
+    Lists, tuples and arrays are converted in one vectorized pass and returned as a
+    JSON-serializable list of floats.
     """
+    if isinstance(val, (list, tuple, np.ndarray)):
+        return np.real(np.asarray(val, dtype=np.complex128)).tolist()
     if hasattr(val, "real"):
         return float(val.real)
-    return val 
\ No newline at end of file
+    return val 
+
+
+def row_to_dict(row) -> Dict[str, Any]:
+    """
+    Read the mapped column values of an ORM object into a plain dict.
+    """
+    return {attr.key: getattr(row, attr.key) for attr in inspect(row).mapper.column_attrs}
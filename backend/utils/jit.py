@@ -0,0 +1,21 @@
+"""
+Optional Numba JIT compilation for numeric kernels.
+
+When numba is not installed, `njit` leaves the decorated function as plain Python.
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.info("numba is not installed, numeric kernels run as plain Python")
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit, usable with or without arguments."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func